@@ -6,8 +6,10 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/launchcg/dex/internal/adapter"
 	"github.com/launchcg/dex/internal/jsonutil"
@@ -22,6 +24,10 @@ type Executor struct {
 	projectRoot string
 	manifest    *manifest.Manifest
 	force       bool
+
+	// ensuredDirs records absolute directory paths already known to exist,
+	// so repeated plans and files sharing a directory skip redundant mkdirs.
+	ensuredDirs map[string]struct{}
 }
 
 // NewExecutor creates a new plan executor.
@@ -30,6 +36,7 @@ func NewExecutor(projectRoot string, m *manifest.Manifest, force bool) *Executor
 		projectRoot: projectRoot,
 		manifest:    m,
 		force:       force,
+		ensuredDirs: make(map[string]struct{}),
 	}
 }
 
@@ -43,15 +50,19 @@ func (e *Executor) RemoveStaleEntries(pkgName string, newFilePaths, newDirPaths
 		return nil
 	}
 
+	// Directories may be removed below, so forget what was ensured
+	clear(e.ensuredDirs)
+
 	// Remove stale files
+	var stale []string
 	for _, oldFile := range old.Files {
 		if !newFilePaths[oldFile] {
-			path := filepath.Join(e.projectRoot, oldFile)
-			if err := os.Remove(path); err != nil && !os.IsNotExist(err) {
-				return fmt.Errorf("removing stale file %s: %w", oldFile, err)
-			}
+			stale = append(stale, oldFile)
 		}
 	}
+	if err := removeFiles(e.projectRoot, stale); err != nil {
+		return err
+	}
 
 	// Remove stale directories (reverse order so deepest dirs are removed first)
 	for j := len(old.Directories) - 1; j >= 0; j-- {
@@ -84,8 +95,9 @@ func (e *Executor) Execute(plan *adapter.Plan, vars map[string]string) error {
 			return fmt.Errorf("creating directories: %w", err)
 		}
 
-		// Write dedicated files
-		if err := e.writeFiles(plan.Files, vars); err != nil {
+		// Write dedicated files, checking conflicts against a single snapshot
+		// of the tracked files rather than rescanning the manifest per file.
+		if err := e.writeFiles(plan.Files, vars, e.manifest.TrackedFiles()); err != nil {
 			return fmt.Errorf("writing files: %w", err)
 		}
 	}
@@ -186,6 +198,9 @@ func (e *Executor) createDirectories(dirs []adapter.DirectoryCreate) error {
 		path := filepath.Join(e.projectRoot, dir.Path)
 		if dir.Parents {
 			// Create with parents (like mkdir -p)
+			if _, ok := e.ensuredDirs[path]; ok {
+				continue
+			}
 			if err := os.MkdirAll(path, 0755); err != nil {
 				return fmt.Errorf("creating directory %s: %w", dir.Path, err)
 			}
@@ -195,42 +210,139 @@ func (e *Executor) createDirectories(dirs []adapter.DirectoryCreate) error {
 				return fmt.Errorf("creating directory %s: %w", dir.Path, err)
 			}
 		}
+		e.ensuredDirs[path] = struct{}{}
 	}
 	return nil
 }
 
-// writeFiles writes all files in the plan.
-func (e *Executor) writeFiles(files []adapter.FileWrite, vars map[string]string) error {
-	for _, fw := range files {
-		if err := e.writeFile(fw, vars); err != nil {
+// maxFileWorkers caps the number of files written or removed concurrently.
+var maxFileWorkers = min(32, runtime.NumCPU()*4)
+
+// forEachFile calls fn for each index in [0, n) using up to maxFileWorkers
+// goroutines. With a single worker it stops at the first error. Otherwise
+// every call runs even if some fail, and the error from the lowest failing
+// index is returned so reporting stays deterministic.
+func forEachFile(n int, fn func(i int) error) error {
+	workers := min(maxFileWorkers, n)
+	if workers <= 1 {
+		for i := 0; i < n; i++ {
+			if err := fn(i); err != nil {
+				return err
+			}
+		}
+		return nil
+	}
+
+	errs := make([]error, n)
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				errs[i] = fn(i)
+			}
+		}()
+	}
+	for i := 0; i < n; i++ {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
+	for _, err := range errs {
+		if err != nil {
 			return err
 		}
 	}
 	return nil
 }
 
-// writeFile writes a single file with proper permissions and conflict handling.
-func (e *Executor) writeFile(fw adapter.FileWrite, vars map[string]string) error {
-	path := filepath.Join(e.projectRoot, fw.Path)
+// removeFiles deletes files (relative to root) concurrently, ignoring files
+// that are already gone. All removals are attempted; the first failure in
+// input order is returned.
+func removeFiles(root string, files []string) error {
+	return forEachFile(len(files), func(i int) error {
+		path := filepath.Join(root, files[i])
+		if err := os.Remove(path); err != nil && !os.IsNotExist(err) {
+			return fmt.Errorf("failed to remove file %s: %w", files[i], err)
+		}
+		return nil
+	})
+}
+
+// writeFiles writes all files in the plan.
+// tracked maps manifest-tracked file paths to their owning package.
+// Every destination is checked for conflicts before anything is written, so
+// an unmanaged file stops the install with the plan untouched. Parent
+// directories are created up front so that the concurrent writers never race
+// on directory creation. Plans that write the same path more than once are
+// written sequentially so the last write still wins. If any writes fail, the
+// error for the earliest file in plan order is returned.
+func (e *Executor) writeFiles(files []adapter.FileWrite, vars map[string]string, tracked map[string]string) error {
+	// Resolve each destination once; writeFile reuses the absolute path.
+	absPaths := make([]string, len(files))
+	for i, fw := range files {
+		absPaths[i] = filepath.Join(e.projectRoot, fw.Path)
+	}
 
-	// Check for conflicts
-	if _, err := os.Stat(path); err == nil {
-		// File exists - check if it's tracked by manifest
-		if _, tracked := e.manifest.IsTracked(fw.Path); !tracked {
-			if !e.force {
-				return fmt.Errorf("file %s already exists and is not managed by dex (use --force to overwrite)", fw.Path)
+	if err := e.checkConflicts(files, absPaths, tracked); err != nil {
+		return err
+	}
+
+	paths := make(map[string]struct{}, len(files))
+	for i, fw := range files {
+		paths[fw.Path] = struct{}{}
+		dir := filepath.Dir(absPaths[i])
+		if _, ok := e.ensuredDirs[dir]; ok {
+			continue
+		}
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			return fmt.Errorf("creating parent directory for %s: %w", fw.Path, err)
+		}
+		e.ensuredDirs[dir] = struct{}{}
+	}
+
+	if len(paths) != len(files) {
+		for i, fw := range files {
+			if err := e.writeFile(fw, absPaths[i], vars); err != nil {
+				return err
 			}
-			// Force mode - warn but continue
-			fmt.Fprintf(os.Stderr, "warning: overwriting non-managed file %s\n", fw.Path)
 		}
-		// If file is tracked by a package (reinstall case), this is OK - proceed to overwrite
+		return nil
 	}
 
-	// Ensure parent directory exists
-	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
-		return fmt.Errorf("creating parent directory for %s: %w", fw.Path, err)
+	return forEachFile(len(files), func(i int) error {
+		return e.writeFile(files[i], absPaths[i], vars)
+	})
+}
+
+// checkConflicts returns an error for the first file in plan order that
+// already exists and is not tracked by the manifest. In force mode such files
+// are reported as warnings and overwritten instead.
+func (e *Executor) checkConflicts(files []adapter.FileWrite, absPaths []string, tracked map[string]string) error {
+	for i, fw := range files {
+		if _, err := os.Stat(absPaths[i]); err != nil {
+			continue
+		}
+		// If file is tracked by a package (reinstall case), this is OK - proceed to overwrite
+		if _, ok := tracked[fw.Path]; ok {
+			continue
+		}
+		if !e.force {
+			return fmt.Errorf("file %s already exists and is not managed by dex (use --force to overwrite)", fw.Path)
+		}
+		// Force mode - warn but continue
+		fmt.Fprintf(os.Stderr, "warning: overwriting non-managed file %s\n", fw.Path)
 	}
+	return nil
+}
 
+// writeFile writes a single file to path (fw.Path resolved against the project
+// root) with proper permissions. Conflicts must already have been checked and
+// the parent directory must already exist.
+func (e *Executor) writeFile(fw adapter.FileWrite, path string, vars map[string]string) error {
 	// Process content with template variables if any
 	content := fw.Content
 	if len(vars) > 0 {
@@ -277,24 +389,32 @@ func parseChmod(s string) (os.FileMode, error) {
 // ReadJSONFile reads and parses a JSON file.
 // Returns empty map if file doesn't exist.
 func ReadJSONFile(path string) (map[string]any, error) {
+	result, _, err := readJSONFileRaw(path)
+	return result, err
+}
+
+// readJSONFileRaw is like ReadJSONFile but also returns the raw file bytes
+// (nil if the file doesn't exist), so callers can detect unchanged output
+// without reading the file a second time.
+func readJSONFileRaw(path string) (map[string]any, []byte, error) {
 	data, err := os.ReadFile(path)
 	if err != nil {
 		if os.IsNotExist(err) {
-			return make(map[string]any), nil
+			return make(map[string]any), nil, nil
 		}
-		return nil, err
+		return nil, nil, err
 	}
 
 	var result map[string]any
 	if err := json.Unmarshal(data, &result); err != nil {
-		return nil, fmt.Errorf("parsing JSON file %s: %w", path, err)
+		return nil, nil, fmt.Errorf("parsing JSON file %s: %w", path, err)
 	}
 
 	if result == nil {
 		result = make(map[string]any)
 	}
 
-	return result, nil
+	return result, data, nil
 }
 
 // WriteJSONFile writes a map as formatted JSON.
@@ -14,6 +14,7 @@
 package installer
 
 import (
+	"bytes"
 	stderrors "errors"
 	"fmt"
 	"os"
@@ -24,6 +25,7 @@ import (
 	"github.com/launchcg/dex/internal/adapter"
 	"github.com/launchcg/dex/internal/config"
 	"github.com/launchcg/dex/internal/errors"
+	"github.com/launchcg/dex/internal/fsutil"
 	"github.com/launchcg/dex/internal/jsonutil"
 	"github.com/launchcg/dex/internal/lockfile"
 	"github.com/launchcg/dex/internal/manifest"
@@ -64,6 +66,15 @@ type Installer struct {
 	removedServers map[string]bool
 	// removedSettings tracks settings values from uninstalled packages.
 	removedSettings map[string]map[string]bool
+
+	// namespacedPackages is the set form of project.Project.NamespacePackages,
+	// built on first use by shouldNamespacePackage.
+	namespacedPackages map[string]bool
+
+	// installing is the chain of packages whose dependencies are currently
+	// being installed, and installingIndex maps each name to its position.
+	installing      []string
+	installingIndex map[string]int
 }
 
 // PackageSpec specifies a package to install.
@@ -213,13 +224,14 @@ func (i *Installer) shouldNamespacePackage(packageName string) bool {
 	}
 
 	// Check package-specific namespace config
-	for _, pkg := range i.project.Project.NamespacePackages {
-		if pkg == packageName {
-			return true
+	if i.namespacedPackages == nil {
+		i.namespacedPackages = make(map[string]bool, len(i.project.Project.NamespacePackages))
+		for _, pkg := range i.project.Project.NamespacePackages {
+			i.namespacedPackages[pkg] = true
 		}
 	}
 
-	return false
+	return i.namespacedPackages[packageName]
 }
 
 // Install installs the specified packages.
@@ -399,7 +411,12 @@ func (i *Installer) installPackage(spec PackageSpec) (*InstalledPackage, error)
 
 	// Install dependencies first
 	if len(pkgConfig.Dependencies) > 0 {
-		if err := i.installDependencies(pkgConfig.Dependencies, pkgName); err != nil {
+		if err := i.enterInstall(pkgName); err != nil {
+			return nil, errors.NewInstallError(pkgName, "resolve", err)
+		}
+		err := i.installDependencies(pkgConfig.Dependencies, pkgName)
+		i.leaveInstall()
+		if err != nil {
 			return nil, err
 		}
 	}
@@ -535,6 +552,31 @@ func (i *Installer) collectAllContributions() error {
 	return nil
 }
 
+// enterInstall pushes a package onto the chain of packages whose dependencies
+// are being installed. Returns a CycleError with the offending chain if the
+// package is already on it.
+func (i *Installer) enterInstall(pkgName string) error {
+	if idx, ok := i.installingIndex[pkgName]; ok {
+		chain := make([]string, 0, len(i.installing)-idx+1)
+		chain = append(chain, i.installing[idx:]...)
+		chain = append(chain, pkgName)
+		return &resolver.CycleError{Packages: chain}
+	}
+	if i.installingIndex == nil {
+		i.installingIndex = make(map[string]int)
+	}
+	i.installingIndex[pkgName] = len(i.installing)
+	i.installing = append(i.installing, pkgName)
+	return nil
+}
+
+// leaveInstall pops the most recently entered package from the install chain.
+func (i *Installer) leaveInstall() {
+	last := len(i.installing) - 1
+	delete(i.installingIndex, i.installing[last])
+	i.installing = i.installing[:last]
+}
+
 // installDependencies installs the dependencies of a package.
 func (i *Installer) installDependencies(deps []config.DependencyBlock, parentName string) error {
 	for _, dep := range deps {
@@ -908,7 +950,7 @@ func (i *Installer) generateMCPConfig(mcpPath, mcpKey string) error {
 	}
 
 	// Read existing config (preserves non-dex entries)
-	existing, err := ReadJSONFile(fullPath)
+	existing, existingRaw, err := readJSONFileRaw(fullPath)
 	if err != nil {
 		return fmt.Errorf("reading MCP config: %w", err)
 	}
@@ -961,11 +1003,8 @@ func (i *Installer) generateMCPConfig(mcpPath, mcpKey string) error {
 			return fmt.Errorf("marshaling MCP config: %w", marshalErr)
 		}
 		content = append(content, '\n')
-		if contentChanged(fullPath, content) {
-			if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
-				return fmt.Errorf("creating directory for MCP config: %w", err)
-			}
-			if err := os.WriteFile(fullPath, content, 0644); err != nil {
+		if !bytes.Equal(existingRaw, content) {
+			if err := fsutil.WriteFileAtomic(fullPath, content, 0644); err != nil {
 				return fmt.Errorf("writing MCP config: %w", err)
 			}
 		}
@@ -979,6 +1018,16 @@ func (i *Installer) generateMCPConfig(mcpPath, mcpKey string) error {
 	return nil
 }
 
+// settingsValueSet returns the value set for key in m, creating it if needed.
+func settingsValueSet(m map[string]map[string]bool, key string) map[string]bool {
+	set, ok := m[key]
+	if !ok {
+		set = make(map[string]bool)
+		m[key] = set
+	}
+	return set
+}
+
 // generateSettingsConfig regenerates the settings config file from scratch.
 // Non-dex entries are preserved by reading the existing file, removing
 // all dex-managed settings values, and adding back current contributions.
@@ -989,25 +1038,21 @@ func (i *Installer) generateSettingsConfig(settingsPath string) error {
 	dexValues := make(map[string]map[string]bool)
 	for _, pkg := range i.manifest.Packages {
 		for key, vals := range pkg.SettingsValues {
-			if dexValues[key] == nil {
-				dexValues[key] = make(map[string]bool)
-			}
+			set := settingsValueSet(dexValues, key)
 			for _, v := range vals {
-				dexValues[key][v] = true
+				set[v] = true
 			}
 		}
 	}
 	for key, vals := range i.removedSettings {
-		if dexValues[key] == nil {
-			dexValues[key] = make(map[string]bool)
-		}
+		set := settingsValueSet(dexValues, key)
 		for v := range vals {
-			dexValues[key][v] = true
+			set[v] = true
 		}
 	}
 
 	// Read existing config (preserves non-dex entries)
-	existing, err := ReadJSONFile(fullPath)
+	existing, existingRaw, err := readJSONFileRaw(fullPath)
 	if err != nil {
 		return fmt.Errorf("reading settings config: %w", err)
 	}
@@ -1047,11 +1092,8 @@ func (i *Installer) generateSettingsConfig(settingsPath string) error {
 			return fmt.Errorf("marshaling settings config: %w", marshalErr)
 		}
 		content = append(content, '\n')
-		if contentChanged(fullPath, content) {
-			if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
-				return fmt.Errorf("creating directory for settings config: %w", err)
-			}
-			if err := os.WriteFile(fullPath, content, 0644); err != nil {
+		if !bytes.Equal(existingRaw, content) {
+			if err := fsutil.WriteFileAtomic(fullPath, content, 0644); err != nil {
 				return fmt.Errorf("writing settings config: %w", err)
 			}
 		}
@@ -1168,7 +1210,7 @@ func (i *Installer) searchRegistries(pkgName string) (string, registry.Registry,
 
 // resolveVariables resolves variable values from environment and config.
 func (i *Installer) resolveVariables(pkg *config.PackageConfig, pkgConfig map[string]string) (map[string]string, error) {
-	vars := make(map[string]string)
+	vars := make(map[string]string, len(pkg.Variables))
 
 	for _, v := range pkg.Variables {
 		value, err := v.ResolveValue(pkgConfig)
@@ -1194,11 +1236,9 @@ func (i *Installer) Uninstall(names []string, removeFromConfig bool) error {
 				i.removedServers[server] = true
 			}
 			for key, vals := range pm.SettingsValues {
-				if i.removedSettings[key] == nil {
-					i.removedSettings[key] = make(map[string]bool)
-				}
+				set := settingsValueSet(i.removedSettings, key)
 				for _, v := range vals {
-					i.removedSettings[key][v] = true
+					set[v] = true
 				}
 			}
 		}
@@ -1250,12 +1290,8 @@ func (i *Installer) uninstallPackage(name string) error {
 	result := i.manifest.Untrack(name)
 
 	// Delete tracked files
-	for _, file := range result.Files {
-		path := filepath.Join(i.projectRoot, file)
-		if err := os.Remove(path); err != nil && !os.IsNotExist(err) {
-			return errors.NewInstallError(name, "uninstall",
-				fmt.Errorf("failed to remove file %s: %w", file, err))
-		}
+	if err := removeFiles(i.projectRoot, result.Files); err != nil {
+		return errors.NewInstallError(name, "uninstall", err)
 	}
 
 	// Delete empty directories (in reverse order to handle nested dirs)
@@ -12,6 +12,7 @@ import (
 
 	"github.com/launchcg/dex/internal/adapter"
 	"github.com/launchcg/dex/internal/manifest"
+	"github.com/launchcg/dex/internal/resolver"
 	"github.com/launchcg/dex/internal/resource"
 )
 
@@ -149,6 +150,60 @@ func TestExecutor_WriteFile_Conflict(t *testing.T) {
 	assert.Equal(t, "original content", string(content))
 }
 
+func TestExecutor_WriteFiles_ConflictLeavesPlanUnwritten(t *testing.T) {
+	tmpDir := t.TempDir()
+	m := newTestManifest(t, tmpDir)
+	executor := NewExecutor(tmpDir, m, false)
+
+	existingFile := filepath.Join(tmpDir, "existing.txt")
+	require.NoError(t, os.WriteFile(existingFile, []byte("original content"), 0644))
+
+	plan := &adapter.Plan{PackageName: "test-plugin"}
+	for i := 0; i < 10; i++ {
+		plan.Files = append(plan.Files, adapter.FileWrite{Path: fmt.Sprintf("dir%d/file%d.txt", i%3, i), Content: "new"})
+	}
+	plan.Files = append(plan.Files[:5], append([]adapter.FileWrite{{Path: "existing.txt", Content: "new content"}}, plan.Files[5:]...)...)
+
+	err := executor.Execute(plan, nil)
+	assert.EqualError(t, err, "writing files: file existing.txt already exists and is not managed by dex (use --force to overwrite)")
+
+	// Nothing from the plan was written, before or after the conflict
+	for _, fw := range plan.Files {
+		if fw.Path == "existing.txt" {
+			continue
+		}
+		_, statErr := os.Stat(filepath.Join(tmpDir, fw.Path))
+		assert.True(t, os.IsNotExist(statErr), "%s should not be written", fw.Path)
+	}
+	content, err := os.ReadFile(existingFile)
+	require.NoError(t, err)
+	assert.Equal(t, "original content", string(content))
+	assert.Nil(t, m.GetPackage("test-plugin"))
+}
+
+func TestExecutor_WriteFiles_ManyFiles(t *testing.T) {
+	tmpDir := t.TempDir()
+	m := newTestManifest(t, tmpDir)
+	executor := NewExecutor(tmpDir, m, false)
+
+	plan := &adapter.Plan{PackageName: "test-plugin"}
+	for i := 0; i < 100; i++ {
+		plan.Files = append(plan.Files, adapter.FileWrite{
+			Path:    fmt.Sprintf("dir%d/file%d.txt", i%7, i),
+			Content: fmt.Sprintf("content %d {{name}}", i),
+		})
+	}
+
+	require.NoError(t, executor.Execute(plan, map[string]string{"name": "plugin"}))
+
+	for i, fw := range plan.Files {
+		content, err := os.ReadFile(filepath.Join(tmpDir, fw.Path))
+		require.NoError(t, err)
+		assert.Equal(t, fmt.Sprintf("content %d plugin", i), string(content))
+	}
+	assert.Len(t, m.GetPackage("test-plugin").Files, 100)
+}
+
 func TestExecutor_WriteFile_Force(t *testing.T) {
 	tmpDir := t.TempDir()
 	m := newTestManifest(t, tmpDir)
@@ -707,6 +762,61 @@ func TestWriteJSONFile_CreatesDir(t *testing.T) {
 	require.NoError(t, err)
 }
 
+func TestReadJSONFileRaw_ReturnsBytes(t *testing.T) {
+	tmpDir := t.TempDir()
+	jsonFile := filepath.Join(tmpDir, "config.json")
+
+	result, raw, err := readJSONFileRaw(jsonFile)
+	require.NoError(t, err)
+	assert.Equal(t, map[string]any{}, result)
+	assert.Nil(t, raw)
+
+	content := []byte("{\"key\": \"value\"}\n")
+	require.NoError(t, os.WriteFile(jsonFile, content, 0644))
+
+	result, raw, err = readJSONFileRaw(jsonFile)
+	require.NoError(t, err)
+	assert.Equal(t, map[string]any{"key": "value"}, result)
+	assert.Equal(t, content, raw)
+}
+
+func TestRemoveFiles(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	var files []string
+	for n := 0; n < 50; n++ {
+		rel := filepath.Join("dir", fmt.Sprintf("file%d.md", n))
+		require.NoError(t, os.MkdirAll(filepath.Join(tmpDir, "dir"), 0755))
+		require.NoError(t, os.WriteFile(filepath.Join(tmpDir, rel), []byte("x"), 0644))
+		files = append(files, rel)
+	}
+	// Already-removed files are not an error
+	files = append(files, filepath.Join("dir", "missing.md"))
+
+	require.NoError(t, removeFiles(tmpDir, files))
+
+	entries, err := os.ReadDir(filepath.Join(tmpDir, "dir"))
+	require.NoError(t, err)
+	assert.Empty(t, entries)
+}
+
+func TestRemoveFiles_ContinuesPastFailures(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	// A non-empty directory cannot be removed with os.Remove
+	require.NoError(t, os.MkdirAll(filepath.Join(tmpDir, "busy"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(tmpDir, "busy", "keep"), []byte("x"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(tmpDir, "a.md"), []byte("x"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(tmpDir, "b.md"), []byte("x"), 0644))
+
+	err := removeFiles(tmpDir, []string{"a.md", "busy", "b.md"})
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "failed to remove file busy")
+
+	assert.NoFileExists(t, filepath.Join(tmpDir, "a.md"))
+	assert.NoFileExists(t, filepath.Join(tmpDir, "b.md"))
+}
+
 func TestProcessTemplate(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -1287,6 +1397,25 @@ package "app" {
 	assert.Equal(t, []string{"orphan-pkg", "utils"}, orphansExcludingApp)
 }
 
+func TestInstaller_EnterInstall_DetectsCycle(t *testing.T) {
+	inst := &Installer{}
+
+	require.NoError(t, inst.enterInstall("app"))
+	require.NoError(t, inst.enterInstall("lib-a"))
+	require.NoError(t, inst.enterInstall("lib-b"))
+
+	err := inst.enterInstall("lib-a")
+	var cycleErr *resolver.CycleError
+	require.ErrorAs(t, err, &cycleErr)
+	assert.Equal(t, []string{"lib-a", "lib-b", "lib-a"}, cycleErr.Packages)
+
+	// Leaving unwinds the chain so the package can be entered again later
+	inst.leaveInstall()
+	inst.leaveInstall()
+	require.NoError(t, inst.enterInstall("lib-a"))
+	assert.Equal(t, []string{"app", "lib-a"}, inst.installing)
+}
+
 func TestUpdateResult_Fields(t *testing.T) {
 	result := &UpdateResult{
 		Name:       "test-pkg",
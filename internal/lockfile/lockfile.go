@@ -6,11 +6,13 @@
 package lockfile
 
 import (
+	"crypto/sha256"
 	"encoding/json"
 	"os"
 	"path/filepath"
 	"sort"
 
+	"github.com/launchcg/dex/internal/fsutil"
 	"github.com/launchcg/dex/internal/jsonutil"
 )
 
@@ -36,6 +38,10 @@ type LockFile struct {
 
 	// path is the path to the lock file (not serialized)
 	path string
+
+	// savedHash is the SHA-256 of the lock file contents as last read or
+	// written, used to skip rewriting an unchanged lock file (not serialized)
+	savedHash [sha256.Size]byte
 }
 
 // LockedPackage represents a locked package version.
@@ -78,6 +84,7 @@ func Load(projectRoot string) (*LockFile, error) {
 
 	// Ensure path is set after unmarshaling
 	l.path = lockPath
+	l.savedHash = sha256.Sum256(data)
 
 	// Ensure Packages map is initialized
 	if l.Packages == nil {
@@ -88,6 +95,8 @@ func Load(projectRoot string) (*LockFile, error) {
 }
 
 // Save writes the lock file to disk.
+// The write is skipped if the serialized contents are identical to what was
+// last loaded or saved, and otherwise replaces the file atomically.
 func (l *LockFile) Save() error {
 	// Sort package entries for consistent output
 	data, err := jsonutil.MarshalIndent(l, "", "  ")
@@ -95,7 +104,16 @@ func (l *LockFile) Save() error {
 		return err
 	}
 
-	return os.WriteFile(l.path, data, 0644)
+	hash := sha256.Sum256(data)
+	if hash == l.savedHash {
+		return nil
+	}
+
+	if err := fsutil.WriteFileAtomic(l.path, data, 0644); err != nil {
+		return err
+	}
+	l.savedHash = hash
+	return nil
 }
 
 // Get returns the locked version for a package (nil if not locked).
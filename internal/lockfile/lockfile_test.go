@@ -6,6 +6,7 @@ import (
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestLoad_NonExistent(t *testing.T) {
@@ -120,6 +121,65 @@ func TestSave(t *testing.T) {
 	}
 }
 
+func TestSave_SkipsUnchanged(t *testing.T) {
+	tmpDir := t.TempDir()
+	lockPath := filepath.Join(tmpDir, LockFileName)
+
+	l, err := Load(tmpDir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	l.Set("test-pkg", &LockedPackage{Version: "1.0.0", Resolved: "file:./pkgs/test"})
+	if err := l.Save(); err != nil {
+		t.Fatalf("Save() error = %v", err)
+	}
+
+	// Backdate the file so an unexpected rewrite would be visible
+	past := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(lockPath, past, past); err != nil {
+		t.Fatal(err)
+	}
+
+	// Reload and re-set an identical entry: Save must not touch the file
+	l, err = Load(tmpDir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	l.Set("test-pkg", &LockedPackage{Version: "1.0.0", Resolved: "file:./pkgs/test"})
+	if err := l.Save(); err != nil {
+		t.Fatalf("Save() error = %v", err)
+	}
+	info, err := os.Stat(lockPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if !info.ModTime().Equal(past) {
+		t.Errorf("unchanged lock file was rewritten (mtime %v, want %v)", info.ModTime(), past)
+	}
+
+	// A real change is written
+	l.Set("test-pkg", &LockedPackage{Version: "1.1.0", Resolved: "file:./pkgs/test"})
+	if err := l.Save(); err != nil {
+		t.Fatalf("Save() error = %v", err)
+	}
+	reloaded, err := Load(tmpDir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if got := reloaded.Get("test-pkg").Version; got != "1.1.0" {
+		t.Errorf("Version = %q, want %q", got, "1.1.0")
+	}
+
+	// No temp files are left behind
+	entries, err := os.ReadDir(tmpDir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(entries) != 1 {
+		t.Errorf("expected only %s in directory, found %d entries", LockFileName, len(entries))
+	}
+}
+
 func TestGet_NonExistent(t *testing.T) {
 	tmpDir := t.TempDir()
 
@@ -6,6 +6,7 @@ import (
 	"os"
 	"path/filepath"
 
+	"github.com/launchcg/dex/internal/fsutil"
 	"github.com/launchcg/dex/internal/jsonutil"
 )
 
@@ -86,18 +87,15 @@ func Load(projectRoot string) (*Manifest, error) {
 
 // Save writes the manifest to disk.
 func (m *Manifest) Save() error {
-	// Ensure .dex directory exists
-	if err := os.MkdirAll(filepath.Dir(m.path), 0755); err != nil {
-		return err
-	}
-
 	data, err := jsonutil.MarshalIndent(m, "", "  ")
 	if err != nil {
 		return err
 	}
 
 	data = append(data, '\n')
-	return os.WriteFile(m.path, data, 0644)
+
+	// WriteFileAtomic creates the .dex directory if needed
+	return fsutil.WriteFileAtomic(m.path, data, 0644)
 }
 
 // Track records files and directories for a package.
@@ -233,6 +231,22 @@ func (m *Manifest) IsTracked(filePath string) (string, bool) {
 	return "", false
 }
 
+// TrackedFiles returns an index of every tracked file path to the package that owns it.
+// Callers checking many paths should build this once instead of calling IsTracked per path.
+func (m *Manifest) TrackedFiles() map[string]string {
+	n := 0
+	for _, pm := range m.Packages {
+		n += len(pm.Files)
+	}
+	index := make(map[string]string, n)
+	for pkgName, pm := range m.Packages {
+		for _, f := range pm.Files {
+			index[f] = pkgName
+		}
+	}
+	return index
+}
+
 // IsSettingsValueUsedByOthers checks if a settings value is used by packages other than the specified one.
 func (m *Manifest) IsSettingsValueUsedByOthers(excludePkg, key, value string) bool {
 	for pkgName, pm := range m.Packages {
@@ -1,6 +1,8 @@
 package manifest
 
 import (
+	"os"
+	"path/filepath"
 	"sort"
 	"testing"
 
@@ -135,6 +137,31 @@ func TestManifest_SaveAndLoad_PreservesMergedFiles(t *testing.T) {
 	assert.ElementsMatch(t, []string{"skills/skill1.md", ".mcp.json", "CLAUDE.md"}, allFiles)
 }
 
+func TestManifest_Save_ReplacesAtomically(t *testing.T) {
+	tmpDir := t.TempDir()
+	m, err := Load(tmpDir)
+	require.NoError(t, err)
+
+	m.Track("package1", []string{"skills/skill1.md"}, nil)
+	require.NoError(t, m.Save())
+	m.Track("package1", []string{"skills/skill2.md"}, nil)
+	require.NoError(t, m.Save())
+
+	// Only the manifest remains; no temp files are left behind
+	entries, err := os.ReadDir(filepath.Join(tmpDir, ".dex"))
+	require.NoError(t, err)
+	require.Len(t, entries, 1)
+	assert.Equal(t, "manifest.json", entries[0].Name())
+
+	info, err := os.Stat(filepath.Join(tmpDir, ".dex", "manifest.json"))
+	require.NoError(t, err)
+	assert.Equal(t, os.FileMode(0644), info.Mode().Perm())
+
+	m2, err := Load(tmpDir)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"skills/skill1.md", "skills/skill2.md"}, m2.GetPackage("package1").Files)
+}
+
 func TestManifest_MergedFiles_EmptyByDefault(t *testing.T) {
 	tmpDir := t.TempDir()
 	m, err := Load(tmpDir)
@@ -254,6 +281,32 @@ func TestManifest_AllFiles_MultiplePackages_ExactOutput(t *testing.T) {
 	assert.Equal(t, expected, allFiles)
 }
 
+func TestManifest_TrackedFiles(t *testing.T) {
+	tmpDir := t.TempDir()
+	m, err := Load(tmpDir)
+	require.NoError(t, err)
+
+	m.Track("pkg-a", []string{".claude/skills/a.md", ".claude/commands/a.md"}, nil)
+	m.Track("pkg-b", []string{".claude/skills/b.md"}, nil)
+	m.TrackMergedFile("pkg-b", ".mcp.json")
+
+	index := m.TrackedFiles()
+	assert.Equal(t, map[string]string{
+		".claude/skills/a.md":   "pkg-a",
+		".claude/commands/a.md": "pkg-a",
+		".claude/skills/b.md":   "pkg-b",
+	}, index)
+
+	// Must agree with IsTracked for every path
+	for path, pkg := range index {
+		owner, ok := m.IsTracked(path)
+		assert.True(t, ok)
+		assert.Equal(t, pkg, owner)
+	}
+	_, ok := index[".mcp.json"]
+	assert.False(t, ok, "merged files are not dedicated tracked files")
+}
+
 func TestManifest_RemoveString_Helper(t *testing.T) {
 	// Test the removeString helper function used in installer
 	slice := []string{"a", "b", "c", "d"}
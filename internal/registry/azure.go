@@ -3,25 +3,58 @@
 package registry
 
 import (
-	"bytes"
 	"context"
 	"crypto/sha256"
 	"encoding/hex"
 	"encoding/json"
+	stderrors "errors"
 	"fmt"
 	"io"
+	"net/http"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
+	"github.com/Azure/azure-sdk-for-go/sdk/azcore"
+	"github.com/Azure/azure-sdk-for-go/sdk/azcore/policy"
 	"github.com/Azure/azure-sdk-for-go/sdk/azidentity"
 	"github.com/Azure/azure-sdk-for-go/sdk/storage/azblob"
+	"github.com/Azure/azure-sdk-for-go/sdk/storage/azblob/blob"
+	"github.com/Azure/azure-sdk-for-go/sdk/storage/azblob/container"
 
 	"github.com/launchcg/dex/internal/errors"
 	"github.com/launchcg/dex/pkg/version"
 )
 
+// Tarball downloads are split into blocks of azureDownloadBlockSize bytes,
+// with up to azureDownloadConcurrency blocks in flight at once.
+const (
+	azureDownloadBlockSize   = 4 * 1024 * 1024
+	azureDownloadConcurrency = 8
+)
+
+// azureRetryOptions configures the SDK pipeline's retry policy, which retries
+// throttling, transient 5xx responses and connection errors with exponential
+// backoff. Call sites only see the error once retries are exhausted.
+var azureRetryOptions = policy.RetryOptions{
+	MaxRetries:    5,
+	RetryDelay:    800 * time.Millisecond,
+	MaxRetryDelay: 30 * time.Second,
+}
+
+// azureHTTPClient is shared by all Azure registries so connections to the
+// blob endpoint are pooled across registries. Parallel block downloads and
+// concurrent probes keep several requests in flight per host, more than the
+// default transport keeps idle.
+var azureHTTPClient = func() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = 32
+	return &http.Client{Transport: transport}
+}()
+
 // AzureRegistry handles az:// sources.
 // It supports registry mode (registry.json) and direct tarball URLs.
 //
@@ -37,8 +70,15 @@ type AzureRegistry struct {
 	mode            SourceMode
 	cache           *Cache
 	client          *azblob.Client
+	containerClient *container.Client
 	isDirectTarball bool
 	tarballInfo     *TarballInfo
+	tarballName     string // NormalizeName(tarballInfo.Name), computed once
+
+	// indexMu guards index, the registry.json parsed on first use and shared
+	// by every later lookup through this registry.
+	indexMu sync.Mutex
+	index   *RegistryIndex
 }
 
 // NewAzureRegistry creates a registry from an Azure Blob Storage URL.
@@ -69,7 +109,12 @@ func NewAzureRegistry(url string, mode SourceMode) (*AzureRegistry, error) {
 
 	// Create blob service client
 	serviceURL := fmt.Sprintf("https://%s.blob.core.windows.net", account)
-	client, err := azblob.NewClient(serviceURL, cred, nil)
+	client, err := azblob.NewClient(serviceURL, cred, &azblob.ClientOptions{
+		ClientOptions: azcore.ClientOptions{
+			Transport: azureHTTPClient,
+			Retry:     azureRetryOptions,
+		},
+	})
 	if err != nil {
 		return nil, errors.NewRegistryError(url, "connect",
 			fmt.Errorf("failed to create Azure blob client: %w", err))
@@ -78,10 +123,14 @@ func NewAzureRegistry(url string, mode SourceMode) (*AzureRegistry, error) {
 	// Check if this is a direct tarball URL
 	isDirectTarball := IsTarballURL(url)
 	var tarballInfo *TarballInfo
+	var tarballName string
 
 	if isDirectTarball {
 		filename := GetFilenameFromURL(url)
 		tarballInfo = ParseTarballFilename(filename)
+		if tarballInfo != nil {
+			tarballName = NormalizeName(tarballInfo.Name)
+		}
 	} else {
 		// Normalize prefix - ensure it doesn't end with /
 		prefix = strings.TrimSuffix(prefix, "/")
@@ -95,8 +144,10 @@ func NewAzureRegistry(url string, mode SourceMode) (*AzureRegistry, error) {
 		mode:            mode,
 		cache:           defaultCache,
 		client:          client,
+		containerClient: client.ServiceClient().NewContainerClient(container),
 		isDirectTarball: isDirectTarball,
 		tarballInfo:     tarballInfo,
+		tarballName:     tarballName,
 	}, nil
 }
 
@@ -128,7 +179,7 @@ func (r *AzureRegistry) getPackageFromTarball(name string) (*PackageInfo, error)
 	}
 
 	// If a name is requested, check if it matches
-	if name != "" && !NamesMatch(name, r.tarballInfo.Name) {
+	if name != "" && NormalizeName(name) != r.tarballName {
 		return nil, errors.NewNotFoundError("package", name)
 	}
 
@@ -219,6 +270,7 @@ func (r *AzureRegistry) FetchPackage(resolved *ResolvedPackage, destDir string)
 	cachePath := r.cache.GetPath(cacheKey)
 
 	// Check if already cached
+	var hash string
 	if !r.cache.Has(cacheKey) {
 		// Parse the Azure URL from resolved.URL
 		_, container, blobPath, err := parseAzureURL(resolved.URL)
@@ -226,28 +278,21 @@ func (r *AzureRegistry) FetchPackage(resolved *ResolvedPackage, destDir string)
 			return "", errors.NewInstallError(resolved.Name, "fetch", err)
 		}
 
-		// Download to cache
-		data, err := r.downloadBlobFromContainer(container, blobPath)
+		// Stream the blob into the cache, hashing it on the way when possible
+		hash, err = r.downloadBlobToFile(container, blobPath, cachePath)
 		if err != nil {
 			return "", errors.NewInstallError(resolved.Name, "fetch", err)
 		}
-
-		// Ensure cache directory exists
-		if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
-			return "", errors.NewInstallError(resolved.Name, "fetch", err)
-		}
-
-		// Write to cache file
-		if err := os.WriteFile(cachePath, data, 0644); err != nil {
-			return "", errors.NewInstallError(resolved.Name, "fetch", err)
-		}
 	}
 
 	// Verify integrity if known
 	if resolved.Integrity != "" {
-		hash, err := computeFileHash(cachePath)
-		if err != nil {
-			return "", errors.NewInstallError(resolved.Name, "verify", err)
+		if hash == "" {
+			var err error
+			hash, err = computeFileHash(cachePath)
+			if err != nil {
+				return "", errors.NewInstallError(resolved.Name, "verify", err)
+			}
 		}
 		if hash != resolved.Integrity {
 			os.Remove(cachePath)
@@ -293,51 +338,209 @@ func (r *AzureRegistry) ListPackages() ([]string, error) {
 	return packages, nil
 }
 
-// fetchRegistryIndex downloads and parses registry.json.
+// fetchRegistryIndex returns the parsed registry.json, downloading it on
+// first use only.
 func (r *AzureRegistry) fetchRegistryIndex() (*RegistryIndex, error) {
+	r.indexMu.Lock()
+	defer r.indexMu.Unlock()
+
+	if r.index != nil {
+		return r.index, nil
+	}
+
+	index, err := r.downloadRegistryIndex()
+	if err != nil {
+		return nil, err
+	}
+	r.index = index
+	return index, nil
+}
+
+// downloadRegistryIndex downloads and parses registry.json.
+// The index is decoded directly from the download stream. A copy is kept in
+// the cache with its ETag, and later fetches send If-None-Match so an
+// unchanged index is served from the cache without being transferred.
+func (r *AzureRegistry) downloadRegistryIndex() (*RegistryIndex, error) {
 	blobPath := r.prefix + "/registry.json"
 	if r.prefix == "" {
 		blobPath = "registry.json"
 	}
 
-	data, err := r.downloadBlob(blobPath)
+	cacheKey := r.getIndexCacheKey(blobPath)
+	cachePath := r.cache.GetPath(cacheKey)
+	etagPath := cachePath + ".etag"
+
+	var opts *blob.DownloadStreamOptions
+	if etag, err := os.ReadFile(etagPath); err == nil && r.cache.Has(cacheKey) {
+		ifNoneMatch := azcore.ETag(etag)
+		opts = &blob.DownloadStreamOptions{
+			AccessConditions: &blob.AccessConditions{
+				ModifiedAccessConditions: &blob.ModifiedAccessConditions{IfNoneMatch: &ifNoneMatch},
+			},
+		}
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
+	defer cancel()
+
+	var rawResp *http.Response
+	resp, err := r.client.DownloadStream(policy.WithCaptureResponse(ctx, &rawResp), r.container, blobPath, opts)
+	if opts != nil && notModified(err, rawResp) {
+		if err == nil {
+			resp.Body.Close()
+		}
+		return r.readCachedIndex(cachePath)
+	}
 	if err != nil {
 		return nil, errors.NewRegistryError(r.url, "fetch",
-			fmt.Errorf("failed to fetch registry.json: %w", err))
+			fmt.Errorf("failed to fetch registry.json: failed to download blob az://%s/%s/%s: %w",
+				r.account, r.container, blobPath, err))
+	}
+	defer resp.Body.Close()
+
+	// Tee the stream into a temp file next to the cache entry while decoding.
+	// Caching is best-effort: if the temp file cannot be created or written,
+	// the index is decoded from the stream alone and the cache is left as is.
+	var body io.Reader = resp.Body
+	var cacheOut *cacheWriter
+	tmp, tmpErr := r.createIndexTemp(cachePath)
+	if tmpErr == nil {
+		defer os.Remove(tmp.Name())
+		defer tmp.Close()
+		cacheOut = &cacheWriter{w: tmp}
+		body = io.TeeReader(resp.Body, cacheOut)
 	}
 
 	var index RegistryIndex
-	if err := json.Unmarshal(data, &index); err != nil {
+	if err := json.NewDecoder(body).Decode(&index); err != nil {
 		return nil, errors.NewRegistryError(r.url, "fetch",
 			fmt.Errorf("failed to parse registry.json: %w", err))
 	}
 
+	if tmpErr == nil && resp.ETag != nil {
+		// Drain whatever the decoder left so the cached copy is complete
+		if _, err := io.Copy(io.Discard, body); err == nil && cacheOut.err == nil && tmp.Close() == nil {
+			if os.Rename(tmp.Name(), cachePath) == nil {
+				_ = os.WriteFile(etagPath, []byte(*resp.ETag), 0644)
+			}
+		}
+	}
+
 	return &index, nil
 }
 
-// downloadBlob downloads a blob from the registry's container.
-func (r *AzureRegistry) downloadBlob(blobPath string) ([]byte, error) {
-	return r.downloadBlobFromContainer(r.container, blobPath)
+// notModified reports whether a conditional download was answered with
+// 304 Not Modified. The SDK may surface a 304 either as a ResponseError or as
+// a successful response with an empty body, so both forms are checked.
+func notModified(err error, raw *http.Response) bool {
+	if err != nil {
+		var respErr *azcore.ResponseError
+		return stderrors.As(err, &respErr) && respErr.StatusCode == http.StatusNotModified
+	}
+	return raw != nil && raw.StatusCode == http.StatusNotModified
+}
+
+// cacheWriter forwards writes to w until the first write error, which it
+// records in err. Later writes are dropped, and no write reports an error,
+// so a failing cache file never interrupts the reader feeding it.
+type cacheWriter struct {
+	w   io.Writer
+	err error
+}
+
+func (c *cacheWriter) Write(p []byte) (int, error) {
+	if c.err == nil {
+		_, c.err = c.w.Write(p)
+	}
+	return len(p), nil
+}
+
+// createIndexTemp creates a temporary file alongside the cached index.
+func (r *AzureRegistry) createIndexTemp(cachePath string) (*os.File, error) {
+	if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
+		return nil, err
+	}
+	return os.CreateTemp(filepath.Dir(cachePath), filepath.Base(cachePath)+".tmp*")
+}
+
+// readCachedIndex parses a registry.json previously stored in the cache.
+func (r *AzureRegistry) readCachedIndex(cachePath string) (*RegistryIndex, error) {
+	data, err := os.ReadFile(cachePath)
+	if err != nil {
+		return nil, errors.NewRegistryError(r.url, "fetch",
+			fmt.Errorf("failed to read cached registry.json: %w", err))
+	}
+
+	var index RegistryIndex
+	if err := json.Unmarshal(data, &index); err != nil {
+		return nil, errors.NewRegistryError(r.url, "fetch",
+			fmt.Errorf("failed to parse cached registry.json: %w", err))
+	}
+
+	return &index, nil
 }
 
-// downloadBlobFromContainer downloads a blob from a specific container.
-func (r *AzureRegistry) downloadBlobFromContainer(container, blobPath string) ([]byte, error) {
+// downloadBlobToFile streams a blob to destPath without buffering it in memory.
+// The blob is written to a temporary file in the same directory and renamed
+// into place, so destPath never holds a partial download.
+//
+// The first block is requested as a ranged stream. A blob that fits in it is
+// written and hashed in one pass, and its hash (in the format used by
+// computeFileHash) is returned. Larger blobs are fetched as parallel ranged
+// reads written directly into the file; those blocks arrive out of order, so
+// they cannot be hashed in-stream and "" is returned for the caller to hash
+// the file instead.
+func (r *AzureRegistry) downloadBlobToFile(container, blobPath, destPath string) (string, error) {
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
 	defer cancel()
 
-	resp, err := r.client.DownloadStream(ctx, container, blobPath, nil)
+	resp, err := r.client.DownloadStream(ctx, container, blobPath, &blob.DownloadStreamOptions{
+		Range: blob.HTTPRange{Count: azureDownloadBlockSize},
+	})
 	if err != nil {
-		return nil, fmt.Errorf("failed to download blob az://%s/%s/%s: %w",
+		return "", fmt.Errorf("failed to download blob az://%s/%s/%s: %w",
 			r.account, container, blobPath, err)
 	}
-	defer resp.Body.Close()
-
-	var buf bytes.Buffer
-	if _, err := io.Copy(&buf, resp.Body); err != nil {
-		return nil, fmt.Errorf("failed to read blob: %w", err)
+	if rangeCoversBlob(resp.ContentRange) {
+		defer resp.Body.Close()
+		return writeStreamToFile(resp.Body, destPath)
 	}
+	resp.Body.Close()
 
-	return buf.Bytes(), nil
+	return "", writeFileViaTemp(destPath, func(out *os.File) error {
+		_, err := r.client.DownloadFile(ctx, container, blobPath, out, &azblob.DownloadFileOptions{
+			BlockSize:   azureDownloadBlockSize,
+			Concurrency: azureDownloadConcurrency,
+		})
+		if err != nil {
+			return fmt.Errorf("failed to download blob az://%s/%s/%s: %w",
+				r.account, container, blobPath, err)
+		}
+		return nil
+	})
+}
+
+// rangeCoversBlob reports whether a ranged download's Content-Range
+// ("bytes start-end/total") spans the whole blob. A missing header means the
+// service returned the full blob.
+func rangeCoversBlob(contentRange *string) bool {
+	if contentRange == nil {
+		return true
+	}
+	span, total, ok := strings.Cut(strings.TrimPrefix(*contentRange, "bytes "), "/")
+	if !ok {
+		return false
+	}
+	start, end, ok := strings.Cut(span, "-")
+	if !ok || start != "0" {
+		return false
+	}
+	last, err := strconv.ParseInt(end, 10, 64)
+	if err != nil {
+		return false
+	}
+	size, err := strconv.ParseInt(total, 10, 64)
+	return err == nil && last+1 == size
 }
 
 // getTarballURL returns the Azure URL for a package tarball.
@@ -354,28 +557,82 @@ func (r *AzureRegistry) getTarballURL(name, ver string) (string, error) {
 		fmt.Sprintf("%s-%s.tgz", name, ver),
 	}
 
-	for _, pattern := range patterns {
-		blobPath := pattern
+	blobPaths := make([]string, len(patterns))
+	for idx, pattern := range patterns {
+		blobPaths[idx] = pattern
 		if r.prefix != "" {
-			blobPath = r.prefix + "/" + pattern
+			blobPaths[idx] = r.prefix + "/" + pattern
 		}
+	}
 
-		// Check if blob exists using GetProperties
-		ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
-		_, err := r.client.ServiceClient().NewContainerClient(r.container).NewBlobClient(blobPath).GetProperties(ctx, nil)
-		cancel()
+	// Every pattern starts with the package name, so one listing under that
+	// prefix finds all candidates. Fall back to probing each blob if the
+	// listing fails (e.g. the credential may read blobs but not list them).
+	listPrefix := name
+	if r.prefix != "" {
+		listPrefix = r.prefix + "/" + name
+	}
+	found, err := r.listBlobNames(listPrefix)
+	if err != nil {
+		found = r.probeBlobs(blobPaths)
+	}
 
-		if err == nil {
+	// The first pattern (in order) that exists wins
+	for _, blobPath := range blobPaths {
+		if found[blobPath] {
 			return fmt.Sprintf("az://%s/%s/%s", r.account, r.container, blobPath), nil
 		}
 	}
 
 	// Return first pattern even if not found (let download fail with better error)
-	blobPath := patterns[0]
-	if r.prefix != "" {
-		blobPath = r.prefix + "/" + patterns[0]
+	return fmt.Sprintf("az://%s/%s/%s", r.account, r.container, blobPaths[0]), nil
+}
+
+// listBlobNames returns the names of all blobs in the container under prefix.
+func (r *AzureRegistry) listBlobNames(prefix string) (map[string]bool, error) {
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+
+	names := make(map[string]bool)
+	pager := r.containerClient.NewListBlobsFlatPager(&container.ListBlobsFlatOptions{Prefix: &prefix})
+	for pager.More() {
+		page, err := pager.NextPage(ctx)
+		if err != nil {
+			return nil, err
+		}
+		for _, item := range page.Segment.BlobItems {
+			if item.Name != nil {
+				names[*item.Name] = true
+			}
+		}
+	}
+	return names, nil
+}
+
+// probeBlobs checks which of blobPaths exist using concurrent GetProperties
+// calls.
+func (r *AzureRegistry) probeBlobs(blobPaths []string) map[string]bool {
+	exists := make([]bool, len(blobPaths))
+	var wg sync.WaitGroup
+	for idx, blobPath := range blobPaths {
+		wg.Add(1)
+		go func(idx int, blobPath string) {
+			defer wg.Done()
+			ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+			defer cancel()
+			_, err := r.containerClient.NewBlobClient(blobPath).GetProperties(ctx, nil)
+			exists[idx] = err == nil
+		}(idx, blobPath)
+	}
+	wg.Wait()
+
+	found := make(map[string]bool, len(blobPaths))
+	for idx, blobPath := range blobPaths {
+		if exists[idx] {
+			found[blobPath] = true
+		}
 	}
-	return fmt.Sprintf("az://%s/%s/%s", r.account, r.container, blobPath), nil
+	return found
 }
 
 // getCacheKey returns a unique cache key for this URL.
@@ -384,6 +641,12 @@ func (r *AzureRegistry) getCacheKey(url string) string {
 	return filepath.Join("azure", hex.EncodeToString(hash[:])+".tar.gz")
 }
 
+// getIndexCacheKey returns the cache key for a registry index blob.
+func (r *AzureRegistry) getIndexCacheKey(blobPath string) string {
+	hash := sha256.Sum256([]byte(fmt.Sprintf("az://%s/%s/%s", r.account, r.container, blobPath)))
+	return filepath.Join("azure", hex.EncodeToString(hash[:])+".json")
+}
+
 // parseAzureURL parses an Azure Blob Storage URL into account, container, and blob path.
 // URL format: az://account/container/path/to/blob
 func parseAzureURL(url string) (account, container, blobPath string, err error) {
@@ -391,20 +654,14 @@ func parseAzureURL(url string) (account, container, blobPath string, err error)
 		return "", "", "", fmt.Errorf("invalid Azure URL: must start with az://")
 	}
 
-	// Remove az:// prefix
+	// Remove az:// prefix and split off account and container without
+	// allocating intermediate slices
 	path := strings.TrimPrefix(url, "az://")
-
-	// Split into parts
-	parts := strings.SplitN(path, "/", 3)
-	if len(parts) < 2 || parts[0] == "" || parts[1] == "" {
+	account, rest, _ := strings.Cut(path, "/")
+	container, blobPath, _ = strings.Cut(rest, "/")
+	if account == "" || container == "" {
 		return "", "", "", fmt.Errorf("invalid Azure URL: must be az://account/container[/path]")
 	}
 
-	account = parts[0]
-	container = parts[1]
-	if len(parts) > 2 {
-		blobPath = parts[2]
-	}
-
 	return account, container, blobPath, nil
 }
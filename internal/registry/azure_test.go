@@ -1,8 +1,18 @@
 package registry
 
 import (
+	"bytes"
+	stderrors "errors"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
 	"testing"
 
+	"github.com/Azure/azure-sdk-for-go/sdk/azcore"
+	"github.com/Azure/azure-sdk-for-go/sdk/storage/azblob"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 )
@@ -146,6 +156,223 @@ func TestAzureRegistry_getCacheKey(t *testing.T) {
 	})
 }
 
+func TestAzureRegistry_readCachedIndex(t *testing.T) {
+	cache := NewCache(t.TempDir())
+	reg := &AzureRegistry{url: "az://account/container", account: "account", container: "container", cache: cache}
+
+	key := reg.getIndexCacheKey("registry.json")
+	assert.True(t, strings.HasSuffix(key, ".json"))
+	assert.NotEqual(t, key, reg.getIndexCacheKey("other/registry.json"))
+
+	path := cache.GetPath(key)
+	require.NoError(t, os.MkdirAll(filepath.Dir(path), 0755))
+	require.NoError(t, os.WriteFile(path, []byte(`{"packages":{"my-plugin":{"versions":["1.0.0"],"latest":"1.0.0"}}}`), 0644))
+
+	index, err := reg.readCachedIndex(path)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"1.0.0"}, index.Packages["my-plugin"].Versions)
+
+	_, err = reg.readCachedIndex(filepath.Join(t.TempDir(), "missing.json"))
+	assert.Error(t, err)
+}
+
+func TestAzureRegistry_downloadRegistryIndex_NotModified(t *testing.T) {
+	const body = `{"packages":{"my-plugin":{"versions":["1.0.0"],"latest":"1.0.0"}}}`
+	var requests, notModifiedResponses int
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path != "/container/registry.json" {
+			http.NotFound(w, r)
+			return
+		}
+		requests++
+		if r.Header.Get("If-None-Match") == `"v1"` {
+			notModifiedResponses++
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		w.Header().Set("ETag", `"v1"`)
+		w.Write([]byte(body))
+	}))
+	defer server.Close()
+
+	client, err := azblob.NewClientWithNoCredential(server.URL, nil)
+	require.NoError(t, err)
+
+	cache := NewCache(t.TempDir())
+	newRegistry := func() *AzureRegistry {
+		return &AzureRegistry{
+			url:       "az://account/container",
+			account:   "account",
+			container: "container",
+			mode:      ModeRegistry,
+			cache:     cache,
+			client:    client,
+		}
+	}
+
+	// First fetch downloads the index and caches it with its ETag
+	index, err := newRegistry().downloadRegistryIndex()
+	require.NoError(t, err)
+	assert.Equal(t, "1.0.0", index.Packages["my-plugin"].Latest)
+
+	cachePath := cache.GetPath(newRegistry().getIndexCacheKey("registry.json"))
+	cached, err := os.ReadFile(cachePath)
+	require.NoError(t, err)
+	assert.Equal(t, body, string(cached))
+	etag, err := os.ReadFile(cachePath + ".etag")
+	require.NoError(t, err)
+	assert.Equal(t, `"v1"`, string(etag))
+
+	// A new registry sends If-None-Match and reads the cached copy on 304
+	index, err = newRegistry().downloadRegistryIndex()
+	require.NoError(t, err)
+	assert.Equal(t, []string{"1.0.0"}, index.Packages["my-plugin"].Versions)
+	assert.Equal(t, 2, requests)
+	assert.Equal(t, 1, notModifiedResponses)
+}
+
+func TestAzureRegistry_downloadBlobToFile(t *testing.T) {
+	small := []byte("small tarball")
+	large := bytes.Repeat([]byte("0123456789abcdef"), (azureDownloadBlockSize+1024)/16)
+	blobs := map[string][]byte{
+		"/container/small.tar.gz": small,
+		"/container/large.tar.gz": large,
+	}
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		data, ok := blobs[r.URL.Path]
+		if !ok {
+			http.NotFound(w, r)
+			return
+		}
+		if r.Method == "HEAD" {
+			w.Header().Set("Content-Length", fmt.Sprint(len(data)))
+			return
+		}
+		rng := r.Header.Get("x-ms-range")
+		if rng == "" {
+			rng = r.Header.Get("Range")
+		}
+		var start, end int
+		if _, err := fmt.Sscanf(rng, "bytes=%d-%d", &start, &end); err != nil {
+			w.Write(data)
+			return
+		}
+		end = min(end, len(data)-1)
+		w.Header().Set("Content-Range", fmt.Sprintf("bytes %d-%d/%d", start, end, len(data)))
+		w.Header().Set("Content-Length", fmt.Sprint(end-start+1))
+		w.WriteHeader(http.StatusPartialContent)
+		w.Write(data[start : end+1])
+	}))
+	defer server.Close()
+
+	client, err := azblob.NewClientWithNoCredential(server.URL, nil)
+	require.NoError(t, err)
+	reg := &AzureRegistry{account: "account", container: "container", client: client}
+	dir := t.TempDir()
+
+	t.Run("single block is hashed while streaming", func(t *testing.T) {
+		destPath := filepath.Join(dir, "small.tar.gz")
+		hash, err := reg.downloadBlobToFile("container", "small.tar.gz", destPath)
+		require.NoError(t, err)
+
+		content, err := os.ReadFile(destPath)
+		require.NoError(t, err)
+		assert.Equal(t, small, content)
+		fileHash, err := computeFileHash(destPath)
+		require.NoError(t, err)
+		assert.Equal(t, fileHash, hash)
+	})
+
+	t.Run("larger blobs use parallel ranged reads", func(t *testing.T) {
+		destPath := filepath.Join(dir, "large.tar.gz")
+		hash, err := reg.downloadBlobToFile("container", "large.tar.gz", destPath)
+		require.NoError(t, err)
+		assert.Empty(t, hash)
+
+		content, err := os.ReadFile(destPath)
+		require.NoError(t, err)
+		assert.Equal(t, large, content)
+	})
+}
+
+func TestRangeCoversBlob(t *testing.T) {
+	ptr := func(s string) *string { return &s }
+
+	assert.True(t, rangeCoversBlob(nil))
+	assert.True(t, rangeCoversBlob(ptr("bytes 0-12/13")))
+	assert.False(t, rangeCoversBlob(ptr("bytes 0-4194303/5000000")))
+	assert.False(t, rangeCoversBlob(ptr("bytes 10-12/13")))
+	assert.False(t, rangeCoversBlob(ptr("bytes 0-12/*")))
+	assert.False(t, rangeCoversBlob(ptr("garbage")))
+}
+
+func TestNotModified(t *testing.T) {
+	assert.True(t, notModified(&azcore.ResponseError{StatusCode: http.StatusNotModified}, nil))
+	assert.False(t, notModified(&azcore.ResponseError{StatusCode: http.StatusNotFound}, nil))
+	assert.False(t, notModified(stderrors.New("connection reset"), nil))
+	assert.True(t, notModified(nil, &http.Response{StatusCode: http.StatusNotModified}))
+	assert.False(t, notModified(nil, &http.Response{StatusCode: http.StatusOK}))
+	assert.False(t, notModified(nil, nil))
+}
+
+func TestCacheWriter_StopsAtFirstError(t *testing.T) {
+	var buf bytes.Buffer
+	failing := &failAfterWriter{w: &buf, remaining: 1}
+	cw := &cacheWriter{w: failing}
+
+	n, err := cw.Write([]byte("ok"))
+	assert.NoError(t, err)
+	assert.Equal(t, 2, n)
+	assert.NoError(t, cw.err)
+
+	// The failure is recorded, not returned, and later writes are dropped
+	n, err = cw.Write([]byte("fail"))
+	assert.NoError(t, err)
+	assert.Equal(t, 4, n)
+	assert.Error(t, cw.err)
+
+	_, err = cw.Write([]byte("more"))
+	assert.NoError(t, err)
+	assert.Equal(t, "ok", buf.String())
+	assert.Equal(t, 2, failing.calls)
+}
+
+// failAfterWriter passes the first remaining writes to w and fails after that.
+type failAfterWriter struct {
+	w         *bytes.Buffer
+	remaining int
+	calls     int
+}
+
+func (f *failAfterWriter) Write(p []byte) (int, error) {
+	f.calls++
+	if f.remaining == 0 {
+		return 0, stderrors.New("disk full")
+	}
+	f.remaining--
+	return f.w.Write(p)
+}
+
+func TestAzureRegistry_fetchRegistryIndex_Memoized(t *testing.T) {
+	// With the index already loaded, lookups must not touch the network
+	// (the registry has no client configured).
+	reg := &AzureRegistry{
+		url:  "az://account/container",
+		mode: ModeRegistry,
+		index: &RegistryIndex{Packages: map[string]PackageEntry{
+			"my-plugin": {Versions: []string{"1.0.0", "1.1.0"}, Latest: "1.1.0"},
+		}},
+	}
+
+	info, err := reg.GetPackageInfo("my-plugin")
+	require.NoError(t, err)
+	assert.Equal(t, "1.1.0", info.Latest)
+
+	names, err := reg.ListPackages()
+	require.NoError(t, err)
+	assert.Equal(t, []string{"my-plugin"}, names)
+}
+
 // computeAzureCacheKey replicates the cache key logic for testing
 func computeAzureCacheKey(url string) string {
 	reg := &AzureRegistry{}
@@ -216,6 +443,24 @@ func TestAzureRegistry_TarballInfo(t *testing.T) {
 	}
 }
 
+func TestAzureRegistry_getPackageFromTarball(t *testing.T) {
+	info := &TarballInfo{Name: "My_Plugin", Version: "1.0.0"}
+	reg := &AzureRegistry{
+		url:             "az://account/container/My_Plugin-1.0.0.tar.gz",
+		isDirectTarball: true,
+		tarballInfo:     info,
+		tarballName:     NormalizeName(info.Name),
+	}
+
+	pkg, err := reg.getPackageFromTarball("my-plugin")
+	require.NoError(t, err)
+	assert.Equal(t, "My_Plugin", pkg.Name)
+	assert.Equal(t, []string{"1.0.0"}, pkg.Versions)
+
+	_, err = reg.getPackageFromTarball("other-plugin")
+	assert.Error(t, err)
+}
+
 func TestAzureRegistry_URLFormat(t *testing.T) {
 	// Test that we properly construct Azure blob URLs from components
 	tests := []struct {
@@ -5,6 +5,7 @@ import (
 	"encoding/base64"
 	"fmt"
 	"io"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"sort"
@@ -118,31 +119,46 @@ func computeFileIntegrity(path string) (string, error) {
 func computeDirectoryIntegrity(dirPath string) (string, error) {
 	hash := sha256.New()
 
-	// Collect all files with relative paths
-	var files []string
-	err := filepath.Walk(dirPath, func(path string, info os.FileInfo, err error) error {
+	// Collect all files with their relative and absolute paths. WalkDir yields
+	// paths as root+separator+rel, so the relative path is a prefix slice.
+	type walkedFile struct {
+		rel string
+		abs string
+	}
+	root := filepath.Clean(dirPath)
+	prefix := root + string(filepath.Separator)
+	if root == "." {
+		prefix = ""
+	} else if strings.HasSuffix(root, string(filepath.Separator)) {
+		prefix = root
+	}
+
+	var files []walkedFile
+	err := filepath.WalkDir(root, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories themselves (we'll hash their contents)
-		if info.IsDir() {
+		if d.IsDir() {
 			// Skip .git directories
-			if info.Name() == ".git" {
+			if d.Name() == ".git" {
 				return filepath.SkipDir
 			}
 			return nil
 		}
 
 		// Get relative path
-		relPath, err := filepath.Rel(dirPath, path)
-		if err != nil {
-			return err
+		relPath, ok := strings.CutPrefix(path, prefix)
+		if !ok {
+			var err error
+			if relPath, err = filepath.Rel(root, path); err != nil {
+				return err
+			}
 		}
 
 		// Normalize path separators for cross-platform consistency
-		relPath = filepath.ToSlash(relPath)
-		files = append(files, relPath)
+		files = append(files, walkedFile{rel: filepath.ToSlash(relPath), abs: path})
 		return nil
 	})
 	if err != nil {
@@ -150,24 +166,23 @@ func computeDirectoryIntegrity(dirPath string) (string, error) {
 	}
 
 	// Sort files for deterministic ordering
-	sort.Strings(files)
+	sort.Slice(files, func(i, j int) bool { return files[i].rel < files[j].rel })
 
 	// Hash each file: path + content
-	for _, relPath := range files {
+	for _, f := range files {
 		// Write the relative path (for structural integrity)
-		hash.Write([]byte(relPath))
+		hash.Write([]byte(f.rel))
 		hash.Write([]byte{0}) // null separator
 
 		// Write file content
-		absPath := filepath.Join(dirPath, filepath.FromSlash(relPath))
-		file, err := os.Open(absPath)
+		file, err := os.Open(f.abs)
 		if err != nil {
-			return "", fmt.Errorf("failed to open file %s: %w", relPath, err)
+			return "", fmt.Errorf("failed to open file %s: %w", f.rel, err)
 		}
 
 		if _, err := io.Copy(hash, file); err != nil {
 			file.Close()
-			return "", fmt.Errorf("failed to read file %s: %w", relPath, err)
+			return "", fmt.Errorf("failed to read file %s: %w", f.rel, err)
 		}
 		file.Close()
 
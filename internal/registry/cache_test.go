@@ -552,3 +552,24 @@ func TestComputeIntegrity_NestedDirectories(t *testing.T) {
 
 	assert.Equal(t, "sha256-TPV+ea7rtISVIIi79//zWh2LAySVku/+ZlMGt3e1icw=", integrity)
 }
+
+func TestComputeIntegrity_Directory_PathForms(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	err := os.MkdirAll(filepath.Join(tmpDir, "a", "b"), 0755)
+	require.NoError(t, err)
+	err = os.WriteFile(filepath.Join(tmpDir, "a", "b", "file.txt"), []byte("content"), 0644)
+	require.NoError(t, err)
+
+	expected, err := ComputeIntegrity(tmpDir)
+	require.NoError(t, err)
+
+	// Trailing separators and unclean paths hash identically
+	integrity, err := ComputeIntegrity(tmpDir + string(filepath.Separator))
+	require.NoError(t, err)
+	assert.Equal(t, expected, integrity)
+
+	integrity, err = ComputeIntegrity(filepath.Join(tmpDir, "a") + string(filepath.Separator) + "..")
+	require.NoError(t, err)
+	assert.Equal(t, expected, integrity)
+}
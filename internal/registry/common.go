@@ -3,8 +3,15 @@
 package registry
 
 import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
 	"regexp"
 	"strings"
+	"unicode/utf8"
 )
 
 // TarballInfo holds parsed name and version from a tarball filename.
@@ -43,8 +50,13 @@ func ParseTarballFilename(filename string) *TarballInfo {
 // IsTarballURL checks if a URL points directly to a tarball file.
 // Returns true for URLs ending in .tar.gz or .tgz.
 func IsTarballURL(url string) bool {
-	lower := strings.ToLower(url)
-	return strings.HasSuffix(lower, ".tar.gz") || strings.HasSuffix(lower, ".tgz")
+	return hasSuffixFold(url, ".tar.gz") || hasSuffixFold(url, ".tgz")
+}
+
+// hasSuffixFold reports whether s ends with suffix, ignoring case, without
+// lowercasing a copy of s.
+func hasSuffixFold(s, suffix string) bool {
+	return len(s) >= len(suffix) && strings.EqualFold(s[len(s)-len(suffix):], suffix)
 }
 
 // NormalizeName normalizes a package name for comparison.
@@ -55,10 +67,48 @@ func NormalizeName(name string) string {
 
 // NamesMatch checks if two package names match after normalization.
 // This handles variations like "my-package" vs "my_package".
+// ASCII names, the common case, are compared byte by byte without building
+// normalized copies.
 func NamesMatch(name1, name2 string) bool {
+	if len(name1) == len(name2) {
+		for i := 0; i < len(name1); i++ {
+			c1, c2 := name1[i], name2[i]
+			if c1 >= utf8.RuneSelf || c2 >= utf8.RuneSelf {
+				return NormalizeName(name1) == NormalizeName(name2)
+			}
+			if normalizeNameByte(c1) != normalizeNameByte(c2) {
+				return false
+			}
+		}
+		return true
+	}
+	if isASCII(name1) && isASCII(name2) {
+		return false
+	}
 	return NormalizeName(name1) == NormalizeName(name2)
 }
 
+// normalizeNameByte applies NormalizeName's mapping to a single ASCII byte.
+func normalizeNameByte(c byte) byte {
+	if c == '_' {
+		return '-'
+	}
+	if 'A' <= c && c <= 'Z' {
+		return c + ('a' - 'A')
+	}
+	return c
+}
+
+// isASCII reports whether s contains only ASCII bytes.
+func isASCII(s string) bool {
+	for i := 0; i < len(s); i++ {
+		if s[i] >= utf8.RuneSelf {
+			return false
+		}
+	}
+	return true
+}
+
 // GetFilenameFromURL extracts the filename from a URL path.
 // For example, "https://example.com/path/to/pkg-1.0.0.tar.gz" returns "pkg-1.0.0.tar.gz".
 func GetFilenameFromURL(url string) string {
@@ -76,3 +126,77 @@ func GetFilenameFromURL(url string) string {
 	}
 	return url
 }
+
+// computeFileHash computes the SHA-256 hash of a file.
+// Returns the hash in the format "sha256-{hex}".
+func computeFileHash(path string) (string, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return "", err
+	}
+	defer file.Close()
+
+	hash := sha256.New()
+	if _, err := io.Copy(hash, file); err != nil {
+		return "", err
+	}
+
+	return "sha256-" + hex.EncodeToString(hash.Sum(nil)), nil
+}
+
+// writeStreamToFile streams src to destPath without buffering it in memory
+// and returns its hash in the format used by computeFileHash. The hash is
+// computed while streaming, so the file does not need to be read back.
+func writeStreamToFile(src io.Reader, destPath string) (string, error) {
+	hash := sha256.New()
+	err := writeFileViaTemp(destPath, func(out *os.File) error {
+		if _, err := io.Copy(io.MultiWriter(out, hash), src); err != nil {
+			return fmt.Errorf("failed to write file: %w", err)
+		}
+		return nil
+	})
+	if err != nil {
+		return "", err
+	}
+	return "sha256-" + hex.EncodeToString(hash.Sum(nil)), nil
+}
+
+// writeFileViaTemp creates a uniquely named temporary file next to destPath,
+// fills it with fill and renames it into place, so destPath never holds a
+// partial download and concurrent downloads never share a file. Errors from
+// fill are returned unchanged.
+func writeFileViaTemp(destPath string, fill func(out *os.File) error) error {
+	// Ensure parent directory exists
+	if err := os.MkdirAll(filepath.Dir(destPath), 0755); err != nil {
+		return fmt.Errorf("failed to create directory: %w", err)
+	}
+
+	out, err := os.CreateTemp(filepath.Dir(destPath), filepath.Base(destPath)+".tmp*")
+	if err != nil {
+		return fmt.Errorf("failed to create file: %w", err)
+	}
+	tmpPath := out.Name()
+
+	if err := fill(out); err != nil {
+		out.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+
+	err = out.Chmod(0644)
+	if closeErr := out.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write file: %w", err)
+	}
+
+	// Rename to final path
+	if err := os.Rename(tmpPath, destPath); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to rename file: %w", err)
+	}
+
+	return nil
+}
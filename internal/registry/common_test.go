@@ -1,9 +1,15 @@
 package registry
 
 import (
+	stderrors "errors"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 )
 
 func TestParseTarballFilename(t *testing.T) {
@@ -250,14 +256,32 @@ func TestNamesMatch(t *testing.T) {
 			name2: "plugin",
 			want:  false,
 		},
+		{
+			name:  "non-ASCII case insensitive",
+			name1: "Über_Plugin",
+			name2: "über-plugin",
+			want:  true,
+		},
+		{
+			name:  "non-ASCII different lengths",
+			name1: "ÜBER-plugin",
+			name2: "über-plugins",
+			want:  false,
+		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			got := NamesMatch(tt.name1, tt.name2)
 			assert.Equal(t, tt.want, got)
+			assert.Equal(t, NormalizeName(tt.name1) == NormalizeName(tt.name2), got)
 		})
 	}
+
+	allocs := testing.AllocsPerRun(100, func() {
+		NamesMatch("My_Cool_Plugin", "my-cool-plugin")
+	})
+	assert.Equal(t, 0.0, allocs)
 }
 
 func TestGetFilenameFromURL(t *testing.T) {
@@ -320,3 +344,39 @@ func TestGetFilenameFromURL(t *testing.T) {
 		})
 	}
 }
+
+func TestWriteStreamToFile(t *testing.T) {
+	dir := t.TempDir()
+	destPath := filepath.Join(dir, "nested", "pkg.tar.gz")
+
+	hash, err := writeStreamToFile(strings.NewReader("tarball bytes"), destPath)
+	require.NoError(t, err)
+
+	content, err := os.ReadFile(destPath)
+	require.NoError(t, err)
+	assert.Equal(t, "tarball bytes", string(content))
+
+	fileHash, err := computeFileHash(destPath)
+	require.NoError(t, err)
+	assert.Equal(t, fileHash, hash)
+
+	info, err := os.Stat(destPath)
+	require.NoError(t, err)
+	assert.Equal(t, os.FileMode(0644), info.Mode().Perm())
+
+	// A failed stream leaves neither the destination nor a temp file behind
+	failedPath := filepath.Join(dir, "nested", "failed.tar.gz")
+	_, err = writeStreamToFile(io.MultiReader(strings.NewReader("partial"), errReader{}), failedPath)
+	assert.Error(t, err)
+	_, statErr := os.Stat(failedPath)
+	assert.True(t, os.IsNotExist(statErr))
+
+	entries, err := os.ReadDir(filepath.Join(dir, "nested"))
+	require.NoError(t, err)
+	assert.Len(t, entries, 1)
+}
+
+// errReader fails every read.
+type errReader struct{}
+
+func (errReader) Read([]byte) (int, error) { return 0, stderrors.New("connection reset") }
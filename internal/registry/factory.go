@@ -30,20 +30,20 @@ func NewRegistry(url string, mode SourceMode) (Registry, error) {
 		return NewLocalRegistry(path, mode)
 
 	case "git":
-		// Reconstruct the full git URL (git+ prefix was stripped by ParseSource)
-		return NewGitRegistry("git+"+path, mode)
+		// ParseSource only strips the git+ prefix, so url is already the full git URL
+		return NewGitRegistry(url, mode)
 
 	case "https", "http":
 		// path is the full URL for HTTP(S)
 		return NewHTTPSRegistry(path, mode)
 
 	case "s3":
-		// Reconstruct the full s3:// URL
-		return NewS3Registry("s3://"+path, mode)
+		// ParseSource only strips the s3:// prefix, so pass the original URL
+		return NewS3Registry(url, mode)
 
 	case "az":
-		// Reconstruct the full az:// URL
-		return NewAzureRegistry("az://"+path, mode)
+		// ParseSource only strips the az:// prefix, so pass the original URL
+		return NewAzureRegistry(url, mode)
 
 	default:
 		return nil, fmt.Errorf("unsupported protocol: %s", protocol)
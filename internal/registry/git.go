@@ -5,11 +5,14 @@ package registry
 import (
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 
+	"github.com/go-git/go-billy/v5/osfs"
 	"github.com/go-git/go-git/v5"
 	"github.com/go-git/go-git/v5/config"
 	"github.com/go-git/go-git/v5/plumbing"
@@ -35,6 +38,12 @@ type GitRegistry struct {
 	ref     GitRef     // Branch, tag, or commit (from URL fragment)
 	mode    SourceMode // Registry or package mode
 	cache   *Cache     // Cache for cloned repositories
+
+	// tagsMu guards tags, the remote's tag names listed on first use and
+	// reused by later lookups so each registry queries the remote once.
+	tagsMu     sync.Mutex
+	tags       []string
+	tagsListed bool
 }
 
 // NewGitRegistry creates a registry from a git URL.
@@ -157,19 +166,18 @@ func (r *GitRegistry) getPackageFromManifest(clonePath, name string) (*PackageIn
 		tags = nil
 	}
 
-	// Filter to semver-like tags
-	var versions []string
+	// Filter to semver-like tags, parsing each tag once
+	parsedVersions := make([]*version.Version, 0, len(tags))
 	for _, tag := range tags {
 		// Strip 'v' prefix for normalization
-		v := strings.TrimPrefix(tag, "v")
-		if _, err := version.Parse(v); err == nil {
-			versions = append(versions, v)
+		if v, err := version.Parse(strings.TrimPrefix(tag, "v")); err == nil {
+			parsedVersions = append(parsedVersions, v)
 		}
 	}
 
 	// Sort versions
-	parsedVersions := version.SortStrings(versions)
-	versions = make([]string, len(parsedVersions))
+	version.Sort(parsedVersions)
+	versions := make([]string, len(parsedVersions))
 	for i, v := range parsedVersions {
 		versions[i] = v.String()
 	}
@@ -203,6 +211,13 @@ func (r *GitRegistry) ResolvePackage(name, versionSpec string) (*ResolvedPackage
 	var resolvedVersion string
 	if versionSpec == "latest" || versionSpec == "" {
 		resolvedVersion = info.Latest
+		if resolvedVersion == "" {
+			// registry.json may omit latest; pick the highest version by
+			// semver rather than by its position in the list
+			if latest := version.Latest(parseVersions(info.Versions)); latest != nil {
+				resolvedVersion = latest.String()
+			}
+		}
 	} else {
 		// Parse constraint and find best match
 		constraint, err := version.ParseConstraint(versionSpec)
@@ -210,14 +225,7 @@ func (r *GitRegistry) ResolvePackage(name, versionSpec string) (*ResolvedPackage
 			return nil, errors.NewVersionError(name, versionSpec, info.Versions, "invalid version constraint")
 		}
 
-		var parsedVersions []*version.Version
-		for _, v := range info.Versions {
-			if parsed, err := version.Parse(v); err == nil {
-				parsedVersions = append(parsedVersions, parsed)
-			}
-		}
-
-		best := constraint.FindBest(parsedVersions)
+		best := constraint.FindBest(parseVersions(info.Versions))
 		if best == nil {
 			return nil, errors.NewVersionError(name, versionSpec, info.Versions, "")
 		}
@@ -236,23 +244,48 @@ func (r *GitRegistry) ResolvePackage(name, versionSpec string) (*ResolvedPackage
 	}
 
 	resolvedURL := "git+" + r.repoURL
+	gitRef := GitRef{Type: "default"}
 	if ref != "" {
 		resolvedURL += "#tag=" + ref
+		gitRef = GitRef{Type: "tag", Value: ref}
 	}
 
 	return &ResolvedPackage{
 		Name:    name,
 		Version: resolvedVersion,
 		URL:     resolvedURL,
+		gitRef:  &gitRef,
 	}, nil
 }
 
+// resolvedGitRef returns the ref a resolved package points at. Packages
+// resolved by a GitRegistry carry it; others (e.g. rebuilt from a lock file)
+// have it parsed from their URL.
+func resolvedGitRef(resolved *ResolvedPackage) (GitRef, error) {
+	if resolved.gitRef != nil {
+		return *resolved.gitRef, nil
+	}
+	_, ref, err := parseGitURL(resolved.URL)
+	return ref, err
+}
+
+// parseVersions parses version strings, skipping any that are not valid semver.
+func parseVersions(versions []string) []*version.Version {
+	parsed := make([]*version.Version, 0, len(versions))
+	for _, v := range versions {
+		if p, err := version.Parse(v); err == nil {
+			parsed = append(parsed, p)
+		}
+	}
+	return parsed
+}
+
 // FetchPackage clones/copies the repo to destDir.
 // Uses shallow clone (depth 1) for efficiency.
 // Authentication is handled externally via git credential helpers or SSH agent.
 func (r *GitRegistry) FetchPackage(resolved *ResolvedPackage, destDir string) (string, error) {
 	// Parse the resolved URL to get the ref
-	_, ref, err := parseGitURL(resolved.URL)
+	ref, err := resolvedGitRef(resolved)
 	if err != nil {
 		return "", errors.NewRegistryError(resolved.URL, "parse", err)
 	}
@@ -266,7 +299,7 @@ func (r *GitRegistry) FetchPackage(resolved *ResolvedPackage, destDir string) (s
 		if err := os.RemoveAll(pkgDir); err != nil && !os.IsNotExist(err) {
 			return "", fmt.Errorf("failed to remove existing directory: %w", err)
 		}
-		if err := copyDir(cachedPath, pkgDir); err != nil {
+		if err := linkDir(cachedPath, pkgDir); err != nil {
 			return "", fmt.Errorf("failed to copy from cache: %w", err)
 		}
 		return pkgDir, nil
@@ -278,42 +311,20 @@ func (r *GitRegistry) FetchPackage(resolved *ResolvedPackage, destDir string) (s
 		return "", fmt.Errorf("failed to remove existing directory: %w", err)
 	}
 
-	cloneOpts := &git.CloneOptions{
-		URL:   r.repoURL,
-		Depth: 1,
-	}
-
-	// Set reference if specified
-	if ref.Value != "" {
-		switch ref.Type {
-		case "tag":
-			cloneOpts.ReferenceName = plumbing.NewTagReferenceName(ref.Value)
-		case "branch":
-			cloneOpts.ReferenceName = plumbing.NewBranchReferenceName(ref.Value)
-		}
-	}
-
 	// Clone the repository
 	// Authentication is handled externally via:
 	// - HTTPS: Git credential helpers
 	// - SSH: SSH agent or ~/.ssh keys
-	_, err = git.PlainClone(pkgDir, false, cloneOpts)
-	if err != nil {
+	if err := r.cloneWorktree(pkgDir, ref); err != nil {
 		return "", errors.NewRegistryError(r.repoURL, "clone", err)
 	}
 
-	// Remove .git directory to reduce size
-	gitDir := filepath.Join(pkgDir, ".git")
-	if err := os.RemoveAll(gitDir); err != nil {
-		return "", fmt.Errorf("failed to remove .git directory: %w", err)
-	}
-
-	// Cache for future use by copying to cache directory
+	// Cache for future use by hard-linking into the cache directory
 	cachePath := r.cache.GetPath(cacheKey)
 	if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
 		return "", fmt.Errorf("failed to create cache directory: %w", err)
 	}
-	if err := copyDir(pkgDir, cachePath); err != nil {
+	if err := linkDir(pkgDir, cachePath); err != nil {
 		return "", fmt.Errorf("failed to copy to cache: %w", err)
 	}
 
@@ -412,6 +423,40 @@ func (r *GitRegistry) getCacheKeyForRef(ref GitRef) string {
 	return r.repoURL + "#" + refStr
 }
 
+// cloneOptions returns options for a shallow clone of ref.
+// Only the requested branch or tag is fetched, and no other tags, so the
+// clone transfers a single commit's tree rather than every ref's tip.
+func (r *GitRegistry) cloneOptions(ref GitRef) *git.CloneOptions {
+	opts := &git.CloneOptions{
+		URL:          r.repoURL,
+		Depth:        1,
+		SingleBranch: true,
+		Tags:         git.NoTags,
+	}
+
+	// Set reference if specified
+	if ref.Value != "" {
+		switch ref.Type {
+		case "tag":
+			opts.ReferenceName = plumbing.NewTagReferenceName(ref.Value)
+		case "branch":
+			opts.ReferenceName = plumbing.NewBranchReferenceName(ref.Value)
+		}
+	}
+	return opts
+}
+
+// cloneWorktree checks out a shallow clone of ref into dir. The git objects
+// are kept in memory, so only the working tree is written to disk and there
+// is no .git directory to remove afterwards.
+func (r *GitRegistry) cloneWorktree(dir string, ref GitRef) error {
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return err
+	}
+	_, err := git.Clone(memory.NewStorage(), osfs.New(dir), r.cloneOptions(ref))
+	return err
+}
+
 // cloneToCache clones the repo to cache directory.
 // Authentication is handled externally via git credential helpers or SSH agent.
 func (r *GitRegistry) cloneToCache() (string, error) {
@@ -422,52 +467,31 @@ func (r *GitRegistry) cloneToCache() (string, error) {
 		return r.cache.GetPath(cacheKey), nil
 	}
 
-	// Clone to temp directory
-	tempDir, err := os.MkdirTemp("", "dex-git-clone-*")
+	cachePath := r.cache.GetPath(cacheKey)
+	if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
+		return "", fmt.Errorf("failed to create cache directory: %w", err)
+	}
+
+	// Clone into a staging directory next to the cache entry, so the
+	// finished clone is renamed into place rather than copied
+	stagingDir, err := os.MkdirTemp(filepath.Dir(cachePath), filepath.Base(cachePath)+".tmp*")
 	if err != nil {
 		return "", fmt.Errorf("failed to create temp directory: %w", err)
 	}
-	defer os.RemoveAll(tempDir)
-
-	cloneDest := filepath.Join(tempDir, "repo")
+	defer os.RemoveAll(stagingDir)
 
-	cloneOpts := &git.CloneOptions{
-		URL:   r.repoURL,
-		Depth: 1,
-	}
-
-	// Set reference if specified
-	if r.ref.Value != "" {
-		switch r.ref.Type {
-		case "tag":
-			cloneOpts.ReferenceName = plumbing.NewTagReferenceName(r.ref.Value)
-		case "branch":
-			cloneOpts.ReferenceName = plumbing.NewBranchReferenceName(r.ref.Value)
-		}
-	}
+	cloneDest := filepath.Join(stagingDir, "repo")
 
 	// Clone the repository
 	// Authentication is handled externally via:
 	// - HTTPS: Git credential helpers
 	// - SSH: SSH agent or ~/.ssh keys
-	_, err = git.PlainClone(cloneDest, false, cloneOpts)
-	if err != nil {
+	if err := r.cloneWorktree(cloneDest, r.ref); err != nil {
 		return "", fmt.Errorf("failed to clone repository: %w", err)
 	}
 
-	// Remove .git directory to reduce size
-	gitDir := filepath.Join(cloneDest, ".git")
-	if err := os.RemoveAll(gitDir); err != nil {
-		return "", fmt.Errorf("failed to remove .git directory: %w", err)
-	}
-
 	// Cache the clone
-	cachePath := r.cache.GetPath(cacheKey)
-	if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
-		return "", fmt.Errorf("failed to create cache directory: %w", err)
-	}
-
-	if err := copyDir(cloneDest, cachePath); err != nil {
+	if err := moveDir(cloneDest, cachePath); err != nil {
 		return "", fmt.Errorf("failed to copy to cache: %w", err)
 	}
 
@@ -475,9 +499,16 @@ func (r *GitRegistry) cloneToCache() (string, error) {
 }
 
 // listTags returns all tags in the repository.
+// The remote is queried once; later calls return the same list.
 // Uses ls-remote which doesn't require authentication for public repos.
 // For private repos, authentication is handled externally.
 func (r *GitRegistry) listTags() ([]string, error) {
+	r.tagsMu.Lock()
+	defer r.tagsMu.Unlock()
+	if r.tagsListed {
+		return r.tags, nil
+	}
+
 	// Use git ls-remote to list tags without cloning
 	rem := git.NewRemote(memory.NewStorage(), &config.RemoteConfig{
 		Name: "origin",
@@ -497,11 +528,36 @@ func (r *GitRegistry) listTags() ([]string, error) {
 		}
 	}
 
+	r.tags = tags
+	r.tagsListed = true
 	return tags, nil
 }
 
 // copyDir copies a directory recursively.
 func copyDir(src, dst string) error {
+	return copyTree(src, dst, copyFile)
+}
+
+// linkDir recreates a directory tree at dst whose files are hard links to
+// those in src, falling back to copying files that cannot be linked (for
+// example when src and dst are on different filesystems). Used to restore
+// packages from the cache, which are never modified in place.
+func linkDir(src, dst string) error {
+	return copyTree(src, dst, linkFile)
+}
+
+// moveDir moves the directory src to dst, copying it when a rename is not
+// possible (for example when the temp directory is on another filesystem).
+func moveDir(src, dst string) error {
+	if err := os.Rename(src, dst); err == nil {
+		return nil
+	}
+	return copyDir(src, dst)
+}
+
+// copyTree recreates the directory tree at src under dst, using copyFn for
+// each file.
+func copyTree(src, dst string, copyFn func(src, dst string) error) error {
 	srcInfo, err := os.Stat(src)
 	if err != nil {
 		return err
@@ -521,11 +577,11 @@ func copyDir(src, dst string) error {
 		dstPath := filepath.Join(dst, entry.Name())
 
 		if entry.IsDir() {
-			if err := copyDir(srcPath, dstPath); err != nil {
+			if err := copyTree(srcPath, dstPath, copyFn); err != nil {
 				return err
 			}
 		} else {
-			if err := copyFile(srcPath, dstPath); err != nil {
+			if err := copyFn(srcPath, dstPath); err != nil {
 				return err
 			}
 		}
@@ -535,18 +591,38 @@ func copyDir(src, dst string) error {
 }
 
 // copyFile copies a single file.
+// The copy is streamed, so on Linux the kernel moves the data with
+// copy_file_range (a reflink on filesystems that support it) instead of
+// reading the whole file into memory.
 func copyFile(src, dst string) error {
-	srcInfo, err := os.Stat(src)
+	in, err := os.Open(src)
+	if err != nil {
+		return err
+	}
+	defer in.Close()
+
+	srcInfo, err := in.Stat()
 	if err != nil {
 		return err
 	}
 
-	data, err := os.ReadFile(src)
+	out, err := os.OpenFile(dst, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, srcInfo.Mode())
 	if err != nil {
 		return err
 	}
+	if _, err := io.Copy(out, in); err != nil {
+		out.Close()
+		return err
+	}
+	return out.Close()
+}
 
-	return os.WriteFile(dst, data, srcInfo.Mode())
+// linkFile hard-links src to dst, copying it if the link cannot be made.
+func linkFile(src, dst string) error {
+	if err := os.Link(src, dst); err == nil {
+		return nil
+	}
+	return copyFile(src, dst)
 }
 
 // contains checks if a string slice contains a value.
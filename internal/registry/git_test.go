@@ -5,6 +5,8 @@ import (
 	"path/filepath"
 	"testing"
 
+	"github.com/go-git/go-git/v5"
+	"github.com/go-git/go-git/v5/plumbing"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 )
@@ -488,6 +490,103 @@ func TestCopyDir(t *testing.T) {
 	assert.Equal(t, "content2", string(content2))
 }
 
+func TestGitRegistry_listTags_Memoized(t *testing.T) {
+	// An unreachable remote proves the listed tags are served from memory
+	reg := &GitRegistry{
+		repoURL:    "https://invalid.invalid/repo.git",
+		tags:       []string{"v1.0.0", "v1.1.0"},
+		tagsListed: true,
+	}
+
+	tags, err := reg.listTags()
+	require.NoError(t, err)
+	assert.Equal(t, []string{"v1.0.0", "v1.1.0"}, tags)
+}
+
+func TestGitRegistry_cloneOptions(t *testing.T) {
+	reg := &GitRegistry{repoURL: "https://example.com/repo.git"}
+
+	opts := reg.cloneOptions(GitRef{Type: "tag", Value: "v1.0.0"})
+	assert.Equal(t, "https://example.com/repo.git", opts.URL)
+	assert.Equal(t, 1, opts.Depth)
+	assert.True(t, opts.SingleBranch)
+	assert.Equal(t, git.NoTags, opts.Tags)
+	assert.Equal(t, plumbing.NewTagReferenceName("v1.0.0"), opts.ReferenceName)
+
+	opts = reg.cloneOptions(GitRef{Type: "branch", Value: "main"})
+	assert.Equal(t, plumbing.NewBranchReferenceName("main"), opts.ReferenceName)
+
+	opts = reg.cloneOptions(GitRef{Type: "default"})
+	assert.Equal(t, plumbing.ReferenceName(""), opts.ReferenceName)
+}
+
+func TestGitRegistry_ResolvePackage_LatestBySemver(t *testing.T) {
+	reg := &GitRegistry{
+		repoURL:    "https://example.com/repo.git",
+		mode:       ModeRegistry,
+		cache:      NewCache(t.TempDir()),
+		tags:       []string{"v1.10.0", "v1.9.0"},
+		tagsListed: true,
+	}
+
+	// A cached clone whose registry.json lists versions out of order and
+	// does not name a latest version
+	clonePath := reg.cache.GetPath(reg.getCacheKey())
+	require.NoError(t, os.MkdirAll(clonePath, 0755))
+	index := `{"packages": {"my-plugin": {"versions": ["1.10.0", "1.9.0"]}}}`
+	require.NoError(t, os.WriteFile(filepath.Join(clonePath, "registry.json"), []byte(index), 0644))
+
+	resolved, err := reg.ResolvePackage("my-plugin", "latest")
+	require.NoError(t, err)
+	assert.Equal(t, "1.10.0", resolved.Version)
+	assert.Equal(t, "git+https://example.com/repo.git#tag=v1.10.0", resolved.URL)
+
+	// The resolved ref travels with the package and matches its URL
+	ref, err := resolvedGitRef(resolved)
+	require.NoError(t, err)
+	assert.Equal(t, GitRef{Type: "tag", Value: "v1.10.0"}, ref)
+	_, urlRef, err := parseGitURL(resolved.URL)
+	require.NoError(t, err)
+	assert.Equal(t, urlRef, ref)
+}
+
+func TestLinkDir(t *testing.T) {
+	srcDir := t.TempDir()
+	require.NoError(t, os.MkdirAll(filepath.Join(srcDir, "subdir"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "file1.txt"), []byte("content1"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "subdir", "file2.txt"), []byte("content2"), 0644))
+
+	dstDir := filepath.Join(t.TempDir(), "linked")
+	require.NoError(t, linkDir(srcDir, dstDir))
+
+	content2, err := os.ReadFile(filepath.Join(dstDir, "subdir", "file2.txt"))
+	require.NoError(t, err)
+	assert.Equal(t, "content2", string(content2))
+
+	// Within one filesystem the files are hard links, not copies
+	srcInfo, err := os.Stat(filepath.Join(srcDir, "file1.txt"))
+	require.NoError(t, err)
+	dstInfo, err := os.Stat(filepath.Join(dstDir, "file1.txt"))
+	require.NoError(t, err)
+	assert.True(t, os.SameFile(srcInfo, dstInfo))
+}
+
+func TestMoveDir(t *testing.T) {
+	srcDir := filepath.Join(t.TempDir(), "src")
+	require.NoError(t, os.MkdirAll(filepath.Join(srcDir, "subdir"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(srcDir, "subdir", "file.txt"), []byte("content"), 0644))
+
+	dstDir := filepath.Join(t.TempDir(), "dst")
+	require.NoError(t, moveDir(srcDir, dstDir))
+
+	content, err := os.ReadFile(filepath.Join(dstDir, "subdir", "file.txt"))
+	require.NoError(t, err)
+	assert.Equal(t, "content", string(content))
+
+	_, err = os.Stat(srcDir)
+	assert.True(t, os.IsNotExist(err))
+}
+
 func TestCopyFile(t *testing.T) {
 	srcDir := t.TempDir()
 	dstDir := t.TempDir()
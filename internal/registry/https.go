@@ -25,12 +25,24 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/launchcg/dex/internal/errors"
 	"github.com/launchcg/dex/pkg/version"
 )
 
+// httpsClient is shared by all HTTPS registries so keep-alive connections and
+// TLS sessions to a host are reused across index, probe and tarball requests.
+var httpsClient = func() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = 8
+	return &http.Client{
+		Transport: transport,
+		Timeout:   30 * time.Second,
+	}
+}()
+
 // HTTPSRegistry handles https:// sources.
 // It supports registry mode (registry.json) and direct tarball URLs.
 type HTTPSRegistry struct {
@@ -40,6 +52,11 @@ type HTTPSRegistry struct {
 	client          *http.Client
 	isDirectTarball bool
 	tarballInfo     *TarballInfo
+
+	// indexMu guards index, the registry.json parsed on first use and shared
+	// by every later lookup through this registry.
+	indexMu sync.Mutex
+	index   *RegistryIndex
 }
 
 // NewHTTPSRegistry creates a registry from an HTTPS URL.
@@ -58,11 +75,6 @@ func NewHTTPSRegistry(url string, mode SourceMode) (*HTTPSRegistry, error) {
 		return nil, errors.NewRegistryError(url, "connect", err)
 	}
 
-	// Create HTTP client with timeout
-	client := &http.Client{
-		Timeout: 30 * time.Second,
-	}
-
 	// Check if this is a direct tarball URL
 	isDirectTarball := IsTarballURL(url)
 	var tarballInfo *TarballInfo
@@ -80,7 +92,7 @@ func NewHTTPSRegistry(url string, mode SourceMode) (*HTTPSRegistry, error) {
 		baseURL:         url,
 		mode:            mode,
 		cache:           cache,
-		client:          client,
+		client:          httpsClient,
 		isDirectTarball: isDirectTarball,
 		tarballInfo:     tarballInfo,
 	}, nil
@@ -212,18 +224,24 @@ func (r *HTTPSRegistry) FetchPackage(resolved *ResolvedPackage, destDir string)
 	cachePath := r.cache.GetPath(cacheKey)
 
 	// Check if already cached
+	var hash string
 	if !r.cache.Has(cacheKey) {
-		// Download to cache
-		if err := r.downloadFile(resolved.URL, cachePath); err != nil {
+		// Download to cache, hashing it on the way
+		var err error
+		hash, err = r.downloadFile(resolved.URL, cachePath)
+		if err != nil {
 			return "", errors.NewInstallError(resolved.Name, "fetch", err)
 		}
 	}
 
 	// Verify integrity if known
 	if resolved.Integrity != "" {
-		hash, err := computeFileHash(cachePath)
-		if err != nil {
-			return "", errors.NewInstallError(resolved.Name, "verify", err)
+		if hash == "" {
+			var err error
+			hash, err = computeFileHash(cachePath)
+			if err != nil {
+				return "", errors.NewInstallError(resolved.Name, "verify", err)
+			}
 		}
 		if hash != resolved.Integrity {
 			// Remove corrupted cache file
@@ -272,8 +290,26 @@ func (r *HTTPSRegistry) ListPackages() ([]string, error) {
 	return packages, nil
 }
 
-// fetchRegistryIndex downloads and parses registry.json.
+// fetchRegistryIndex returns the parsed registry.json, downloading it on
+// first use only.
 func (r *HTTPSRegistry) fetchRegistryIndex() (*RegistryIndex, error) {
+	r.indexMu.Lock()
+	defer r.indexMu.Unlock()
+
+	if r.index != nil {
+		return r.index, nil
+	}
+
+	index, err := r.downloadRegistryIndex()
+	if err != nil {
+		return nil, err
+	}
+	r.index = index
+	return index, nil
+}
+
+// downloadRegistryIndex downloads and parses registry.json.
+func (r *HTTPSRegistry) downloadRegistryIndex() (*RegistryIndex, error) {
 	indexURL := r.baseURL + "/registry.json"
 
 	resp, err := r.client.Get(indexURL)
@@ -292,48 +328,26 @@ func (r *HTTPSRegistry) fetchRegistryIndex() (*RegistryIndex, error) {
 		return nil, errors.NewRegistryError(r.baseURL, "fetch",
 			fmt.Errorf("failed to parse registry.json: %w", err))
 	}
+	// Drain any trailing bytes so the connection can go back to the pool
+	io.Copy(io.Discard, resp.Body)
 
 	return &index, nil
 }
 
-// downloadFile downloads a URL to a local file.
-func (r *HTTPSRegistry) downloadFile(url, destPath string) error {
-	// Ensure parent directory exists
-	if err := os.MkdirAll(filepath.Dir(destPath), 0755); err != nil {
-		return fmt.Errorf("failed to create directory: %w", err)
-	}
-
+// downloadFile downloads a URL to a local file and returns its hash, computed
+// while streaming.
+func (r *HTTPSRegistry) downloadFile(url, destPath string) (string, error) {
 	resp, err := r.client.Get(url)
 	if err != nil {
-		return err
+		return "", err
 	}
 	defer resp.Body.Close()
 
 	if resp.StatusCode != http.StatusOK {
-		return fmt.Errorf("HTTP %d: %s", resp.StatusCode, resp.Status)
-	}
-
-	// Create temporary file first
-	tmpPath := destPath + ".tmp"
-	out, err := os.Create(tmpPath)
-	if err != nil {
-		return fmt.Errorf("failed to create file: %w", err)
-	}
-
-	_, err = io.Copy(out, resp.Body)
-	out.Close()
-	if err != nil {
-		os.Remove(tmpPath)
-		return fmt.Errorf("failed to write file: %w", err)
-	}
-
-	// Rename to final path
-	if err := os.Rename(tmpPath, destPath); err != nil {
-		os.Remove(tmpPath)
-		return fmt.Errorf("failed to rename file: %w", err)
+		return "", fmt.Errorf("HTTP %d: %s", resp.StatusCode, resp.Status)
 	}
 
-	return nil
+	return writeStreamToFile(resp.Body, destPath)
 }
 
 // extractTarGz extracts a .tar.gz file to a directory.
@@ -365,6 +379,20 @@ func extractTarGz(tarPath, destDir string) (string, error) {
 	// Track top-level directories to detect single directory tarballs
 	topLevelDirs := make(map[string]bool)
 
+	// Directories already created, so entries sharing a parent only
+	// pay for one MkdirAll
+	madeDirs := map[string]bool{destDir: true}
+	ensureDir := func(dir string, mode os.FileMode) error {
+		if madeDirs[dir] {
+			return nil
+		}
+		if err := os.MkdirAll(dir, mode); err != nil {
+			return err
+		}
+		madeDirs[dir] = true
+		return nil
+	}
+
 	// Extract files
 	for {
 		header, err := tr.Next()
@@ -382,9 +410,8 @@ func extractTarGz(tarPath, destDir string) (string, error) {
 		}
 
 		// Track top-level directory
-		parts := strings.SplitN(name, "/", 2)
-		if len(parts) > 0 && parts[0] != "" && parts[0] != "." {
-			topLevelDirs[parts[0]] = true
+		if top, _, _ := strings.Cut(name, "/"); top != "" && top != "." {
+			topLevelDirs[top] = true
 		}
 
 		target := filepath.Join(destDir, name)
@@ -396,13 +423,13 @@ func extractTarGz(tarPath, destDir string) (string, error) {
 			if mode == 0 {
 				mode = 0755
 			}
-			if err := os.MkdirAll(target, mode); err != nil {
+			if err := ensureDir(target, mode); err != nil {
 				return "", fmt.Errorf("failed to create directory %s: %w", target, err)
 			}
 
 		case tar.TypeReg:
 			// Ensure parent directory exists
-			if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+			if err := ensureDir(filepath.Dir(target), 0755); err != nil {
 				return "", fmt.Errorf("failed to create parent directory: %w", err)
 			}
 
@@ -425,7 +452,7 @@ func extractTarGz(tarPath, destDir string) (string, error) {
 
 		case tar.TypeSymlink:
 			// Create symlink
-			if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+			if err := ensureDir(filepath.Dir(target), 0755); err != nil {
 				return "", fmt.Errorf("failed to create parent directory: %w", err)
 			}
 			if err := os.Symlink(header.Linkname, target); err != nil {
@@ -435,7 +462,7 @@ func extractTarGz(tarPath, destDir string) (string, error) {
 		case tar.TypeLink:
 			// Create hard link
 			linkTarget := filepath.Join(destDir, header.Linkname)
-			if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+			if err := ensureDir(filepath.Dir(target), 0755); err != nil {
 				return "", fmt.Errorf("failed to create parent directory: %w", err)
 			}
 			if err := os.Link(linkTarget, target); err != nil {
@@ -472,21 +499,15 @@ func (r *HTTPSRegistry) getTarballURL(name, ver string) (string, error) {
 		fmt.Sprintf("%s-%s.tgz", name, ver),
 	}
 
-	for _, pattern := range patterns {
-		url := r.baseURL + "/" + pattern
-
-		req, err := http.NewRequest("HEAD", url, nil)
-		if err != nil {
-			continue
-		}
-
-		resp, err := r.client.Do(req)
-		if err != nil {
-			continue
-		}
-		resp.Body.Close()
+	urls := make([]string, len(patterns))
+	for idx, pattern := range patterns {
+		urls[idx] = r.baseURL + "/" + pattern
+	}
 
-		if resp.StatusCode == http.StatusOK {
+	// Probe every candidate at once; the first pattern (in order) that exists wins
+	exists := r.probeURLs(urls)
+	for idx, url := range urls {
+		if exists[idx] {
 			return url, nil
 		}
 	}
@@ -496,27 +517,59 @@ func (r *HTTPSRegistry) getTarballURL(name, ver string) (string, error) {
 	return r.baseURL + "/" + patterns[0], nil
 }
 
-// getCacheKey returns a unique cache key for this URL.
-// The key is a SHA-256 hash of the URL, suitable for use as a filename.
-func (r *HTTPSRegistry) getCacheKey(url string) string {
-	hash := sha256.Sum256([]byte(url))
-	// Use https subdirectory and add extension
-	return filepath.Join("https", hex.EncodeToString(hash[:])+".tar.gz")
+// probeURLs checks which of urls exist using concurrent HEAD requests.
+func (r *HTTPSRegistry) probeURLs(urls []string) []bool {
+	exists := make([]bool, len(urls))
+	var wg sync.WaitGroup
+	for idx, url := range urls {
+		wg.Add(1)
+		go func(idx int, url string) {
+			defer wg.Done()
+			exists[idx] = r.urlExists(url)
+		}(idx, url)
+	}
+	wg.Wait()
+	return exists
+}
+
+// urlExists reports whether url exists, using a HEAD request. Servers that
+// reject HEAD are asked for the first byte with a ranged GET instead.
+func (r *HTTPSRegistry) urlExists(url string) bool {
+	status, ok := r.probeStatus("HEAD", url)
+	if !ok {
+		return false
+	}
+	if status == http.StatusMethodNotAllowed || status == http.StatusNotImplemented {
+		status, ok = r.probeStatus("GET", url)
+		return ok && (status == http.StatusOK || status == http.StatusPartialContent)
+	}
+	return status == http.StatusOK
 }
 
-// computeFileHash computes the SHA-256 hash of a file.
-// Returns the hash in the format "sha256-{hex}".
-func computeFileHash(path string) (string, error) {
-	file, err := os.Open(path)
+// probeStatus sends a bodiless probe for url and returns the response status.
+// GET probes request only the first byte.
+func (r *HTTPSRegistry) probeStatus(method, url string) (int, bool) {
+	req, err := http.NewRequest(method, url, nil)
 	if err != nil {
-		return "", err
+		return 0, false
+	}
+	if method == "GET" {
+		req.Header.Set("Range", "bytes=0-0")
 	}
-	defer file.Close()
 
-	hash := sha256.New()
-	if _, err := io.Copy(hash, file); err != nil {
-		return "", err
+	resp, err := r.client.Do(req)
+	if err != nil {
+		return 0, false
 	}
+	resp.Body.Close()
 
-	return "sha256-" + hex.EncodeToString(hash.Sum(nil)), nil
+	return resp.StatusCode, true
+}
+
+// getCacheKey returns a unique cache key for this URL.
+// The key is a SHA-256 hash of the URL, suitable for use as a filename.
+func (r *HTTPSRegistry) getCacheKey(url string) string {
+	hash := sha256.Sum256([]byte(url))
+	// Use https subdirectory and add extension
+	return filepath.Join("https", hex.EncodeToString(hash[:])+".tar.gz")
 }
@@ -10,6 +10,7 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -138,6 +139,45 @@ func TestHTTPSRegistry_GetPackageInfo_RegistryMode(t *testing.T) {
 	})
 }
 
+func TestNewHTTPSRegistry_SharesClient(t *testing.T) {
+	a, err := NewHTTPSRegistry("https://a.example.com/registry", ModeRegistry)
+	require.NoError(t, err)
+	b, err := NewHTTPSRegistry("https://b.example.com/pkg-1.0.0.tar.gz", ModeRegistry)
+	require.NoError(t, err)
+
+	assert.Same(t, httpsClient, a.client)
+	assert.Same(t, a.client, b.client)
+	assert.Equal(t, 30*time.Second, a.client.Timeout)
+}
+
+func TestHTTPSRegistry_fetchRegistryIndex_Memoized(t *testing.T) {
+	requests := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/registry.json" {
+			requests++
+			json.NewEncoder(w).Encode(RegistryIndex{Packages: map[string]PackageEntry{
+				"my-plugin": {Versions: []string{"1.0.0"}, Latest: "1.0.0"},
+			}})
+			return
+		}
+		http.NotFound(w, r)
+	}))
+	defer server.Close()
+
+	reg, err := NewHTTPSRegistry(server.URL, ModeRegistry)
+	require.NoError(t, err)
+
+	_, err = reg.GetPackageInfo("my-plugin")
+	require.NoError(t, err)
+	_, err = reg.GetPackageInfo("nonexistent")
+	assert.Error(t, err)
+	names, err := reg.ListPackages()
+	require.NoError(t, err)
+	assert.Equal(t, []string{"my-plugin"}, names)
+
+	assert.Equal(t, 1, requests)
+}
+
 func TestHTTPSRegistry_GetPackageInfo_PackageMode(t *testing.T) {
 	// HTTPS sources no longer support package mode - they should return an error
 	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -284,6 +324,60 @@ func TestHTTPSRegistry_ResolvePackage_DirectTarball(t *testing.T) {
 	})
 }
 
+func TestHTTPSRegistry_getTarballURL(t *testing.T) {
+	existing := map[string]bool{
+		"/my-plugin-v1.0.0.tar.gz": true,
+		"/my-plugin-1.0.0.tgz":     true,
+	}
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "HEAD" && existing[r.URL.Path] {
+			w.WriteHeader(http.StatusOK)
+			return
+		}
+		http.NotFound(w, r)
+	}))
+	defer server.Close()
+
+	reg, err := NewHTTPSRegistry(server.URL, ModeRegistry)
+	require.NoError(t, err)
+
+	t.Run("earliest existing pattern wins", func(t *testing.T) {
+		url, err := reg.getTarballURL("my-plugin", "1.0.0")
+		require.NoError(t, err)
+		assert.Equal(t, server.URL+"/my-plugin-v1.0.0.tar.gz", url)
+	})
+
+	t.Run("falls back to first pattern", func(t *testing.T) {
+		url, err := reg.getTarballURL("other", "1.0.0")
+		require.NoError(t, err)
+		assert.Equal(t, server.URL+"/other-1.0.0.tar.gz", url)
+	})
+}
+
+func TestHTTPSRegistry_urlExists_RangedGetFallback(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "HEAD" {
+			w.WriteHeader(http.StatusMethodNotAllowed)
+			return
+		}
+		if r.URL.Path != "/my-plugin-1.0.0.tar.gz" {
+			http.NotFound(w, r)
+			return
+		}
+		assert.Equal(t, "bytes=0-0", r.Header.Get("Range"))
+		w.Header().Set("Content-Range", "bytes 0-0/1024")
+		w.WriteHeader(http.StatusPartialContent)
+		w.Write([]byte{0x1f})
+	}))
+	defer server.Close()
+
+	reg, err := NewHTTPSRegistry(server.URL, ModeRegistry)
+	require.NoError(t, err)
+
+	assert.True(t, reg.urlExists(server.URL+"/my-plugin-1.0.0.tar.gz"))
+	assert.False(t, reg.urlExists(server.URL+"/missing-1.0.0.tar.gz"))
+}
+
 func TestHTTPSRegistry_FetchPackage(t *testing.T) {
 	// Create a test tarball
 	tarballContent := createTestTarball(t, "my-plugin", map[string]string{
@@ -337,6 +431,34 @@ func TestHTTPSRegistry_FetchPackage(t *testing.T) {
 	})
 }
 
+func TestHTTPSRegistry_downloadFile_ReturnsHash(t *testing.T) {
+	content := []byte("tarball bytes")
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write(content)
+	}))
+	defer server.Close()
+
+	reg, err := NewHTTPSRegistry(server.URL, ModeRegistry)
+	require.NoError(t, err)
+
+	destPath := filepath.Join(t.TempDir(), "pkg.tar.gz")
+	hash, err := reg.downloadFile(server.URL+"/pkg.tar.gz", destPath)
+	require.NoError(t, err)
+
+	written, err := os.ReadFile(destPath)
+	require.NoError(t, err)
+	assert.Equal(t, content, written)
+
+	fileHash, err := computeFileHash(destPath)
+	require.NoError(t, err)
+	assert.Equal(t, fileHash, hash)
+
+	// No temporary files are left next to the destination
+	entries, err := os.ReadDir(filepath.Dir(destPath))
+	require.NoError(t, err)
+	assert.Len(t, entries, 1)
+}
+
 func TestHTTPSRegistry_ListPackages(t *testing.T) {
 	t.Run("registry mode", func(t *testing.T) {
 		registryIndex := RegistryIndex{
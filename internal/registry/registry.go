@@ -68,6 +68,10 @@ type ResolvedPackage struct {
 	LocalPath string
 	// Integrity is the SHA-256 hash of the package contents (if known)
 	Integrity string
+
+	// gitRef is the ref a GitRegistry resolved URL to, so FetchPackage
+	// need not parse it back out of the URL
+	gitRef *GitRef
 }
 
 // RegistryIndex represents the registry.json file format.
@@ -131,19 +135,17 @@ func ParseSource(source string) (protocol, path string, err error) {
 	}
 
 	// Handle file:// protocol (special case with multiple formats)
-	if strings.HasPrefix(source, "file:") {
-		rest := source[5:]
+	if rest, ok := strings.CutPrefix(source, "file:"); ok {
 		// file:///absolute/path -> /absolute/path
-		if strings.HasPrefix(rest, "//") {
-			return "file", rest[2:], nil
+		if abs, ok := strings.CutPrefix(rest, "//"); ok {
+			return "file", abs, nil
 		}
 		// file:./relative or file:../relative or file:relative
 		return "file", rest, nil
 	}
 
 	// Handle git+ prefixed protocols
-	if strings.HasPrefix(source, "git+") {
-		rest := source[4:]
+	if rest, ok := strings.CutPrefix(source, "git+"); ok {
 		if strings.HasPrefix(rest, "https://") || strings.HasPrefix(rest, "ssh://") || strings.HasPrefix(rest, "git@") {
 			return "git", rest, nil
 		}
@@ -159,11 +161,11 @@ func ParseSource(source string) (protocol, path string, err error) {
 	}
 
 	// Handle cloud storage protocols
-	if strings.HasPrefix(source, "s3://") {
-		return "s3", strings.TrimPrefix(source, "s3://"), nil
+	if rest, ok := strings.CutPrefix(source, "s3://"); ok {
+		return "s3", rest, nil
 	}
-	if strings.HasPrefix(source, "az://") {
-		return "az", strings.TrimPrefix(source, "az://"), nil
+	if rest, ok := strings.CutPrefix(source, "az://"); ok {
+		return "az", rest, nil
 	}
 
 	return "", "", fmt.Errorf("unsupported source URL format: %s", source)
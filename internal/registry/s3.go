@@ -3,13 +3,11 @@
 package registry
 
 import (
-	"bytes"
 	"context"
 	"crypto/sha256"
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
-	"io"
 	"os"
 	"path/filepath"
 	"strings"
@@ -216,6 +214,7 @@ func (r *S3Registry) FetchPackage(resolved *ResolvedPackage, destDir string) (st
 	cachePath := r.cache.GetPath(cacheKey)
 
 	// Check if already cached
+	var hash string
 	if !r.cache.Has(cacheKey) {
 		// Parse the S3 URL from resolved.URL
 		bucket, key, err := parseS3URL(resolved.URL)
@@ -223,28 +222,21 @@ func (r *S3Registry) FetchPackage(resolved *ResolvedPackage, destDir string) (st
 			return "", errors.NewInstallError(resolved.Name, "fetch", err)
 		}
 
-		// Download to cache
-		data, err := r.downloadObjectFromBucket(bucket, key)
+		// Stream the object into the cache, hashing it on the way
+		hash, err = r.downloadObjectToFile(bucket, key, cachePath)
 		if err != nil {
 			return "", errors.NewInstallError(resolved.Name, "fetch", err)
 		}
-
-		// Ensure cache directory exists
-		if err := os.MkdirAll(filepath.Dir(cachePath), 0755); err != nil {
-			return "", errors.NewInstallError(resolved.Name, "fetch", err)
-		}
-
-		// Write to cache file
-		if err := os.WriteFile(cachePath, data, 0644); err != nil {
-			return "", errors.NewInstallError(resolved.Name, "fetch", err)
-		}
 	}
 
 	// Verify integrity if known
 	if resolved.Integrity != "" {
-		hash, err := computeFileHash(cachePath)
-		if err != nil {
-			return "", errors.NewInstallError(resolved.Name, "verify", err)
+		if hash == "" {
+			var err error
+			hash, err = computeFileHash(cachePath)
+			if err != nil {
+				return "", errors.NewInstallError(resolved.Name, "verify", err)
+			}
 		}
 		if hash != resolved.Integrity {
 			os.Remove(cachePath)
@@ -291,20 +283,25 @@ func (r *S3Registry) ListPackages() ([]string, error) {
 }
 
 // fetchRegistryIndex downloads and parses registry.json.
+// The index is decoded directly from the response body.
 func (r *S3Registry) fetchRegistryIndex() (*RegistryIndex, error) {
 	key := r.prefix + "/registry.json"
 	if r.prefix == "" {
 		key = "registry.json"
 	}
 
-	data, err := r.downloadObject(key)
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
+	defer cancel()
+
+	output, err := r.getObject(ctx, r.bucket, key)
 	if err != nil {
 		return nil, errors.NewRegistryError(r.url, "fetch",
 			fmt.Errorf("failed to fetch registry.json: %w", err))
 	}
+	defer output.Body.Close()
 
 	var index RegistryIndex
-	if err := json.Unmarshal(data, &index); err != nil {
+	if err := json.NewDecoder(output.Body).Decode(&index); err != nil {
 		return nil, errors.NewRegistryError(r.url, "fetch",
 			fmt.Errorf("failed to parse registry.json: %w", err))
 	}
@@ -312,16 +309,8 @@ func (r *S3Registry) fetchRegistryIndex() (*RegistryIndex, error) {
 	return &index, nil
 }
 
-// downloadObject downloads an object from the registry's bucket.
-func (r *S3Registry) downloadObject(key string) ([]byte, error) {
-	return r.downloadObjectFromBucket(r.bucket, key)
-}
-
-// downloadObjectFromBucket downloads an object from a specific bucket.
-func (r *S3Registry) downloadObjectFromBucket(bucket, key string) ([]byte, error) {
-	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
-	defer cancel()
-
+// getObject starts a GetObject request. The caller must close the body.
+func (r *S3Registry) getObject(ctx context.Context, bucket, key string) (*s3.GetObjectOutput, error) {
 	output, err := r.client.GetObject(ctx, &s3.GetObjectInput{
 		Bucket: aws.String(bucket),
 		Key:    aws.String(key),
@@ -329,14 +318,22 @@ func (r *S3Registry) downloadObjectFromBucket(bucket, key string) ([]byte, error
 	if err != nil {
 		return nil, fmt.Errorf("failed to get object s3://%s/%s: %w", bucket, key, err)
 	}
-	defer output.Body.Close()
+	return output, nil
+}
 
-	var buf bytes.Buffer
-	if _, err := io.Copy(&buf, output.Body); err != nil {
-		return nil, fmt.Errorf("failed to read object: %w", err)
+// downloadObjectToFile streams an object to destPath without buffering it in
+// memory and returns its hash, computed while streaming.
+func (r *S3Registry) downloadObjectToFile(bucket, key, destPath string) (string, error) {
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
+	defer cancel()
+
+	output, err := r.getObject(ctx, bucket, key)
+	if err != nil {
+		return "", err
 	}
+	defer output.Body.Close()
 
-	return buf.Bytes(), nil
+	return writeStreamToFile(output.Body, destPath)
 }
 
 // getTarballURL returns the S3 URL for a package tarball.
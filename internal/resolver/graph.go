@@ -2,6 +2,7 @@
 package resolver
 
 import (
+	"container/heap"
 	"fmt"
 	"sort"
 )
@@ -68,69 +69,83 @@ func (g *DepGraph) HasNode(name string) bool {
 }
 
 // AddDependency adds a dependency edge from parent to child with a version constraint.
+// Adding an edge that already exists only updates its constraint, so each
+// parent appears at most once in the child's Dependents.
 func (g *DepGraph) AddDependency(parent, child, constraint string) {
 	parentNode := g.AddNode(parent)
 	childNode := g.AddNode(child)
 
+	if _, exists := parentNode.Dependencies[child]; !exists {
+		childNode.Dependents = append(childNode.Dependents, parent)
+	}
 	parentNode.Dependencies[child] = constraint
-	childNode.Dependents = append(childNode.Dependents, parent)
 }
 
 // TopologicalSort returns the nodes in topological order (dependencies first).
 // Returns an error if the graph contains a cycle.
 func (g *DepGraph) TopologicalSort() ([]string, error) {
-	// Kahn's algorithm
-	inDegree := make(map[string]int)
-	for name := range g.nodes {
-		inDegree[name] = 0
+	// Kahn's algorithm over integer node IDs. IDs are assigned in sorted name
+	// order, so comparing IDs orders nodes exactly as comparing names would.
+	names := g.AllNodes()
+	ids := make(map[string]int, len(names))
+	for id, name := range names {
+		ids[name] = id
 	}
 
-	// Calculate in-degrees
-	for _, node := range g.nodes {
-		for dep := range node.Dependencies {
-			inDegree[dep]++
+	// Lay the edges out in compressed sparse row form: the dependencies of
+	// node id are depIDs[depStart[id]:depStart[id+1]]. Calculate in-degrees
+	// while filling it.
+	depStart := make([]int, len(names)+1)
+	for id, name := range names {
+		depStart[id+1] = depStart[id] + len(g.nodes[name].Dependencies)
+	}
+	depIDs := make([]int, depStart[len(names)])
+	inDegree := make([]int, len(names))
+	for id, name := range names {
+		next := depStart[id]
+		for dep := range g.nodes[name].Dependencies {
+			depID := ids[dep]
+			depIDs[next] = depID
+			next++
+			inDegree[depID]++
 		}
 	}
 
-	// Start with nodes that have no incoming edges (no dependents)
-	var queue []string
-	for name, degree := range inDegree {
+	// Start with nodes that have no incoming edges (no dependents).
+	// The queue is a min-heap so the smallest ready ID is always dequeued
+	// next, which keeps the output deterministic without re-sorting.
+	queue := &idHeap{}
+	for id, degree := range inDegree {
 		if degree == 0 {
-			queue = append(queue, name)
+			*queue = append(*queue, id)
 		}
 	}
+	heap.Init(queue)
 
-	// Sort for deterministic output
-	sort.Strings(queue)
-
-	var result []string
-	for len(queue) > 0 {
+	result := make([]string, 0, len(names))
+	for queue.Len() > 0 {
 		// Dequeue
-		name := queue[0]
-		queue = queue[1:]
-		result = append(result, name)
+		id := heap.Pop(queue).(int)
+		result = append(result, names[id])
 
 		// Decrease in-degree for dependencies
-		node := g.nodes[name]
-		for dep := range node.Dependencies {
+		for _, dep := range depIDs[depStart[id]:depStart[id+1]] {
 			inDegree[dep]--
 			if inDegree[dep] == 0 {
-				queue = append(queue, dep)
-				sort.Strings(queue)
+				heap.Push(queue, dep)
 			}
 		}
 	}
 
 	// Check for cycles
-	if len(result) != len(g.nodes) {
-		// Find nodes in the cycle for error message
+	if len(result) != len(names) {
+		// Find nodes in the cycle for error message (IDs are already in name order)
 		var cycleNodes []string
-		for name, degree := range inDegree {
+		for id, degree := range inDegree {
 			if degree > 0 {
-				cycleNodes = append(cycleNodes, name)
+				cycleNodes = append(cycleNodes, names[id])
 			}
 		}
-		sort.Strings(cycleNodes)
 		return nil, &CycleError{Packages: cycleNodes}
 	}
 
@@ -142,6 +157,24 @@ func (g *DepGraph) TopologicalSort() ([]string, error) {
 	return result, nil
 }
 
+// idHeap is a min-heap of node IDs, used as the ready queue in
+// TopologicalSort.
+type idHeap []int
+
+func (h idHeap) Len() int           { return len(h) }
+func (h idHeap) Less(i, j int) bool { return h[i] < h[j] }
+func (h idHeap) Swap(i, j int)      { h[i], h[j] = h[j], h[i] }
+
+func (h *idHeap) Push(x any) { *h = append(*h, x.(int)) }
+
+func (h *idHeap) Pop() any {
+	old := *h
+	n := len(old)
+	x := old[n-1]
+	*h = old[:n-1]
+	return x
+}
+
 // FindDependents returns all packages that depend on the given package.
 func (g *DepGraph) FindDependents(name string) []string {
 	node := g.nodes[name]
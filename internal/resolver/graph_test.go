@@ -66,6 +66,19 @@ func TestDepGraph_AddDependency(t *testing.T) {
 	assert.Equal(t, []string{"app"}, libNode.Dependents)
 }
 
+func TestDepGraph_AddDependency_Duplicate(t *testing.T) {
+	g := NewDepGraph()
+
+	g.AddDependency("app", "lib", "^1.0.0")
+	g.AddDependency("app", "lib", "^1.2.0")
+	g.AddDependency("tool", "lib", "^1.0.0")
+
+	// The repeated edge updates the constraint without duplicating the dependent
+	assert.Equal(t, "^1.2.0", g.GetNode("app").Dependencies["lib"])
+	assert.Equal(t, []string{"app", "tool"}, g.GetNode("lib").Dependents)
+	assert.Equal(t, []string{"app", "tool"}, g.FindDependents("lib"))
+}
+
 func TestDepGraph_TopologicalSort_Simple(t *testing.T) {
 	g := NewDepGraph()
 
@@ -273,6 +286,26 @@ func TestDepGraph_TopologicalSort_MultiRoot(t *testing.T) {
 	assert.Less(t, utilsIdx, appCIdx)
 }
 
+func TestDepGraph_TopologicalSort_DeterministicOrder(t *testing.T) {
+	g := NewDepGraph()
+
+	// app -> {d, b, c}, b -> a, c -> a
+	g.AddDependency("app", "d", "^1.0.0")
+	g.AddDependency("app", "b", "^1.0.0")
+	g.AddDependency("app", "c", "^1.0.0")
+	g.AddDependency("b", "a", "^1.0.0")
+	g.AddDependency("c", "a", "^1.0.0")
+	g.AddNode("z")
+
+	// Ready packages are always taken in name order, regardless of the
+	// order edges were added or map iteration order
+	for i := 0; i < 20; i++ {
+		order, err := g.TopologicalSort()
+		require.NoError(t, err)
+		assert.Equal(t, []string{"z", "d", "a", "c", "b", "app"}, order)
+	}
+}
+
 // TestDepGraph_TopologicalSort_ComplexGraph tests a complex real-world-like dependency graph.
 func TestDepGraph_TopologicalSort_ComplexGraph(t *testing.T) {
 	g := NewDepGraph()
@@ -14,6 +14,34 @@ type Resolver struct {
 	project    *config.ProjectConfig
 	lock       *lockfile.LockFile
 	registries map[string]registry.Registry
+
+	// compat memoizes constraint checks by (constraint, version) so the same
+	// pair is parsed and evaluated once per resolver.
+	compat map[compatKey]compatResult
+
+	// packages memoizes registry lookups so a package that appears several
+	// times in the graph, or across resolves, is looked up once.
+	packages map[packageKey]*registry.ResolvedPackage
+}
+
+// packageKey identifies a registry lookup.
+type packageKey struct {
+	registry   string
+	name       string
+	constraint string
+}
+
+// compatKey identifies a constraint check.
+type compatKey struct {
+	constraint string
+	version    string
+}
+
+// compatResult is a memoized constraint check. valid is false if either the
+// constraint or the version could not be parsed.
+type compatResult struct {
+	match bool
+	valid bool
 }
 
 // Resolution contains the results of dependency resolution.
@@ -51,6 +79,8 @@ func NewResolver(project *config.ProjectConfig, lock *lockfile.LockFile) *Resolv
 		project:    project,
 		lock:       lock,
 		registries: make(map[string]registry.Registry),
+		compat:     make(map[compatKey]compatResult),
+		packages:   make(map[packageKey]*registry.ResolvedPackage),
 	}
 }
 
@@ -60,19 +90,20 @@ func (r *Resolver) Resolve(specs []PackageSpec) (*Resolution, error) {
 	graph := NewDepGraph()
 	resolved := make(map[string]*ResolvedDep)
 
-	// Process each spec and its transitive dependencies
-	var queue []PackageSpec
-	queue = append(queue, specs...)
-	visited := make(map[string]bool)
-
-	for len(queue) > 0 {
-		spec := queue[0]
-		queue = queue[1:]
-
-		if visited[spec.Name] {
-			continue
+	// Process each spec and its transitive dependencies. Packages are marked
+	// visited when enqueued, so each name is queued at most once; the queue is
+	// FIFO, so the first spec seen for a name is still the one resolved.
+	queue := make([]PackageSpec, 0, len(specs))
+	visited := make(map[string]bool, len(specs))
+	for _, spec := range specs {
+		if !visited[spec.Name] {
+			visited[spec.Name] = true
+			queue = append(queue, spec)
 		}
-		visited[spec.Name] = true
+	}
+
+	for head := 0; head < len(queue); head++ {
+		spec := queue[head]
 
 		// Resolve the package
 		dep, err := r.resolvePackage(spec)
@@ -99,6 +130,7 @@ func (r *Resolver) Resolve(specs []PackageSpec) (*Resolution, error) {
 		for _, pkgDep := range pkgDeps {
 			graph.AddDependency(spec.Name, pkgDep.Name, pkgDep.Version)
 			if !visited[pkgDep.Name] {
+				visited[pkgDep.Name] = true
 				queue = append(queue, PackageSpec{
 					Name:     pkgDep.Name,
 					Version:  pkgDep.Version,
@@ -178,12 +210,17 @@ func (r *Resolver) resolvePackage(spec PackageSpec) (*ResolvedDep, error) {
 		versionConstraint = "latest"
 	}
 
-	resolved, err := reg.ResolvePackage(spec.Name, versionConstraint)
-	if err != nil {
-		return nil, &VersionNotFoundError{
-			Package:    spec.Name,
-			Constraint: versionConstraint,
+	key := packageKey{registry: registryKey(source, registryName), name: spec.Name, constraint: versionConstraint}
+	resolved, ok := r.packages[key]
+	if !ok {
+		resolved, err = reg.ResolvePackage(spec.Name, versionConstraint)
+		if err != nil {
+			return nil, &VersionNotFoundError{
+				Package:    spec.Name,
+				Constraint: versionConstraint,
+			}
 		}
+		r.packages[key] = resolved
 	}
 
 	return &ResolvedDep{
@@ -197,11 +234,7 @@ func (r *Resolver) resolvePackage(spec PackageSpec) (*ResolvedDep, error) {
 
 // getRegistry returns a registry for the given source or registry name.
 func (r *Resolver) getRegistry(source, registryName string) (registry.Registry, error) {
-	// Cache key
-	key := source
-	if key == "" {
-		key = registryName
-	}
+	key := registryKey(source, registryName)
 	if key == "" {
 		return nil, fmt.Errorf("no source or registry specified")
 	}
@@ -242,11 +275,20 @@ func (r *Resolver) getRegistry(source, registryName string) (registry.Registry,
 	return reg, nil
 }
 
+// registryKey returns the key a registry is cached under: the source if set,
+// otherwise the registry name.
+func registryKey(source, registryName string) string {
+	if source != "" {
+		return source
+	}
+	return registryName
+}
+
 // loadPackageDependencies loads the dependencies declared in a package's config.
 func (r *Resolver) loadPackageDependencies(dep *ResolvedDep) ([]config.DependencyBlock, error) {
 	// Check if we have cached dependencies in the lockfile
 	if locked := r.lock.Get(dep.Name); locked != nil && len(locked.Dependencies) > 0 {
-		var deps []config.DependencyBlock
+		deps := make([]config.DependencyBlock, 0, len(locked.Dependencies))
 		for name, ver := range locked.Dependencies {
 			deps = append(deps, config.DependencyBlock{
 				Name:    name,
@@ -265,10 +307,12 @@ func (r *Resolver) loadPackageDependencies(dep *ResolvedDep) ([]config.Dependenc
 func (r *Resolver) detectConflicts(graph *DepGraph, resolved map[string]*ResolvedDep) []*Conflict {
 	var conflicts []*Conflict
 
-	// For each package, check if all dependents' constraints are satisfied
+	// For each package, check if all dependents' constraints are satisfied.
+	// Every name in the graph has a node, and AddDependency creates both ends
+	// of an edge, so nodes and dependents are looked up without nil checks.
 	for _, name := range graph.AllNodes() {
-		node := graph.GetNode(name)
-		if node == nil {
+		node := graph.nodes[name]
+		if len(node.Dependents) == 0 {
 			continue
 		}
 
@@ -277,31 +321,18 @@ func (r *Resolver) detectConflicts(graph *DepGraph, resolved map[string]*Resolve
 			continue
 		}
 
-		resolvedVersion, err := version.Parse(dep.Version)
-		if err != nil {
-			continue // Skip if version can't be parsed
-		}
-
 		var unsatisfied []string
 
 		// Check each dependent's constraint
 		for _, dependentName := range node.Dependents {
-			dependentNode := graph.GetNode(dependentName)
-			if dependentNode == nil {
-				continue
-			}
-
-			constraint, ok := dependentNode.Dependencies[name]
+			constraint, ok := graph.nodes[dependentName].Dependencies[name]
 			if !ok {
 				continue
 			}
 
-			c, err := version.ParseConstraint(constraint)
-			if err != nil {
-				continue // Skip invalid constraints
-			}
-
-			if !c.Match(resolvedVersion) {
+			// Skip unparseable versions and invalid constraints
+			result := r.checkCompatible(constraint, dep.Version)
+			if result.valid && !result.match {
 				unsatisfied = append(unsatisfied, fmt.Sprintf("%s requires %s@%s", dependentName, name, constraint))
 			}
 		}
@@ -318,6 +349,24 @@ func (r *Resolver) detectConflicts(graph *DepGraph, resolved map[string]*Resolve
 	return conflicts
 }
 
+// checkCompatible reports whether ver satisfies constraint, memoizing the result.
+func (r *Resolver) checkCompatible(constraint, ver string) compatResult {
+	key := compatKey{constraint: constraint, version: ver}
+	if result, ok := r.compat[key]; ok {
+		return result
+	}
+
+	var result compatResult
+	if v, err := version.Parse(ver); err == nil {
+		if c, err := version.ParseConstraint(constraint); err == nil {
+			result = compatResult{match: c.Match(v), valid: true}
+		}
+	}
+
+	r.compat[key] = result
+	return result
+}
+
 // ResolveForUpdate resolves packages for an update operation.
 // Unlike regular Resolve, this ignores locked versions and finds the latest matching versions.
 func (r *Resolver) ResolveForUpdate(names []string) (*Resolution, error) {
@@ -8,8 +8,31 @@ import (
 
 	"github.com/launchcg/dex/internal/config"
 	"github.com/launchcg/dex/internal/lockfile"
+	"github.com/launchcg/dex/internal/registry"
 )
 
+// countingRegistry is a registry stub that counts ResolvePackage calls.
+type countingRegistry struct {
+	resolves int
+}
+
+func (c *countingRegistry) Protocol() string { return "stub" }
+
+func (c *countingRegistry) GetPackageInfo(name string) (*registry.PackageInfo, error) {
+	return nil, nil
+}
+
+func (c *countingRegistry) ResolvePackage(name, version string) (*registry.ResolvedPackage, error) {
+	c.resolves++
+	return &registry.ResolvedPackage{Name: name, Version: "1.2.0", URL: "stub://" + name}, nil
+}
+
+func (c *countingRegistry) FetchPackage(resolved *registry.ResolvedPackage, destDir string) (string, error) {
+	return "", nil
+}
+
+func (c *countingRegistry) ListPackages() ([]string, error) { return nil, nil }
+
 func TestNewResolver(t *testing.T) {
 	project := &config.ProjectConfig{
 		Project: config.ProjectBlock{
@@ -178,3 +201,63 @@ func TestResolver_loadPackageDependencies_FromLock(t *testing.T) {
 	assert.Equal(t, "^1.0.0", depNames["dep-a"])
 	assert.Equal(t, ">=2.0.0", depNames["dep-b"])
 }
+
+func TestResolver_checkCompatible(t *testing.T) {
+	r := NewResolver(&config.ProjectConfig{}, &lockfile.LockFile{Packages: make(map[string]*lockfile.LockedPackage)})
+
+	assert.Equal(t, compatResult{match: true, valid: true}, r.checkCompatible("^1.0.0", "1.5.0"))
+	assert.Equal(t, compatResult{match: false, valid: true}, r.checkCompatible("^2.0.0", "1.5.0"))
+	assert.Equal(t, compatResult{}, r.checkCompatible("not-a-constraint", "1.5.0"))
+	assert.Equal(t, compatResult{}, r.checkCompatible("^1.0.0", "not-a-version"))
+
+	// Results are memoized per (constraint, version) pair
+	assert.Len(t, r.compat, 4)
+	assert.Equal(t, compatResult{match: true, valid: true}, r.checkCompatible("^1.0.0", "1.5.0"))
+	assert.Len(t, r.compat, 4)
+}
+
+func TestResolver_resolvePackage_MemoizesRegistryLookups(t *testing.T) {
+	project := &config.ProjectConfig{}
+	lock := &lockfile.LockFile{Packages: make(map[string]*lockfile.LockedPackage)}
+	r := NewResolver(project, lock)
+
+	reg := &countingRegistry{}
+	r.registries["stub"] = reg
+
+	for i := 0; i < 3; i++ {
+		dep, err := r.resolvePackage(PackageSpec{Name: "lib", Version: "^1.0.0", Registry: "stub"})
+		require.NoError(t, err)
+		assert.Equal(t, "1.2.0", dep.Version)
+		assert.Equal(t, "stub://lib", dep.Source)
+	}
+	assert.Equal(t, 1, reg.resolves)
+
+	// A different constraint is a separate lookup
+	_, err := r.resolvePackage(PackageSpec{Name: "lib", Version: "~1.2.0", Registry: "stub"})
+	require.NoError(t, err)
+	assert.Equal(t, 2, reg.resolves)
+}
+
+func TestResolver_CachesSurviveAcrossResolves(t *testing.T) {
+	project := &config.ProjectConfig{
+		Packages: []config.PackageBlock{
+			{Name: "lib", Version: "^1.0.0", Registry: "stub"},
+		},
+	}
+	lock := &lockfile.LockFile{Packages: make(map[string]*lockfile.LockedPackage)}
+	r := NewResolver(project, lock)
+
+	reg := &countingRegistry{}
+	r.registries["stub"] = reg
+
+	res, err := r.Resolve([]PackageSpec{{Name: "lib"}})
+	require.NoError(t, err)
+	assert.Equal(t, "1.2.0", res.Resolved["lib"].Version)
+
+	// ResolveForUpdate swaps in an empty lock but reuses the resolver's caches
+	res, err = r.ResolveForUpdate([]string{"lib"})
+	require.NoError(t, err)
+	assert.Equal(t, "1.2.0", res.Resolved["lib"].Version)
+	assert.Equal(t, 1, reg.resolves)
+	assert.Same(t, lock, r.lock)
+}
@@ -13,6 +13,15 @@ type Engine struct {
 	pkgDir  string
 	ctx     *Context
 	funcMap template.FuncMap
+	cache   *sourceCache
+}
+
+// sourceCache holds file contents and parsed templates read from the package
+// directory, so fragments shared between templates are read and parsed once.
+// It is shared by an engine and the temporary engines derived from it.
+type sourceCache struct {
+	files     map[string]string
+	templates map[string]*template.Template
 }
 
 // NewEngine creates a template engine for the given package directory.
@@ -20,18 +29,33 @@ func NewEngine(pkgDir string, ctx *Context) *Engine {
 	e := &Engine{
 		pkgDir: pkgDir,
 		ctx:    ctx,
+		cache: &sourceCache{
+			files:     make(map[string]string),
+			templates: make(map[string]*template.Template),
+		},
 	}
 	e.funcMap = e.builtinFunctions()
 	return e
 }
 
-// Render processes a template string with the context.
-func (e *Engine) Render(content string) (string, error) {
-	tmpl, err := template.New("content").Funcs(e.funcMap).Parse(content)
+// readFile returns the contents of a file relative to the package directory,
+// reading it from disk only on first use.
+func (e *Engine) readFile(relativePath string) (string, error) {
+	fullPath := filepath.Join(e.pkgDir, relativePath)
+	if content, ok := e.cache.files[fullPath]; ok {
+		return content, nil
+	}
+	data, err := os.ReadFile(fullPath)
 	if err != nil {
-		return "", fmt.Errorf("parsing template: %w", err)
+		return "", err
 	}
+	content := string(data)
+	e.cache.files[fullPath] = content
+	return content, nil
+}
 
+// execute renders a parsed template with the engine's context.
+func (e *Engine) execute(tmpl *template.Template) (string, error) {
 	var buf bytes.Buffer
 	if err := tmpl.Execute(&buf, e.ctx.ToMap()); err != nil {
 		return "", fmt.Errorf("executing template: %w", err)
@@ -40,14 +64,39 @@ func (e *Engine) Render(content string) (string, error) {
 	return buf.String(), nil
 }
 
+// Render processes a template string with the context.
+func (e *Engine) Render(content string) (string, error) {
+	tmpl, err := template.New("content").Funcs(e.funcMap).Parse(content)
+	if err != nil {
+		return "", fmt.Errorf("parsing template: %w", err)
+	}
+
+	return e.execute(tmpl)
+}
+
 // RenderFile reads a file and renders it as a template.
+// Parsed file templates are cached; each render binds this engine's functions
+// to a clone of the cached template.
 func (e *Engine) RenderFile(relativePath string) (string, error) {
 	fullPath := filepath.Join(e.pkgDir, relativePath)
-	content, err := os.ReadFile(fullPath)
+	parsed, ok := e.cache.templates[fullPath]
+	if !ok {
+		content, err := e.readFile(relativePath)
+		if err != nil {
+			return "", fmt.Errorf("reading file %s: %w", relativePath, err)
+		}
+		parsed, err = template.New("content").Funcs(e.funcMap).Parse(content)
+		if err != nil {
+			return "", fmt.Errorf("parsing template: %w", err)
+		}
+		e.cache.templates[fullPath] = parsed
+	}
+
+	tmpl, err := parsed.Clone()
 	if err != nil {
-		return "", fmt.Errorf("reading file %s: %w", relativePath, err)
+		return "", fmt.Errorf("parsing template: %w", err)
 	}
-	return e.Render(string(content))
+	return e.execute(tmpl.Funcs(e.funcMap))
 }
 
 // RenderFileWithVars renders a template file with additional variables.
@@ -63,6 +112,7 @@ func (e *Engine) RenderFileWithVars(relativePath string, vars map[string]any) (s
 	tempEngine := &Engine{
 		pkgDir: e.pkgDir,
 		ctx:    cloned,
+		cache:  e.cache,
 	}
 	tempEngine.funcMap = tempEngine.builtinFunctions()
 
@@ -82,6 +132,7 @@ func (e *Engine) RenderWithVars(content string, vars map[string]any) (string, er
 	tempEngine := &Engine{
 		pkgDir: e.pkgDir,
 		ctx:    cloned,
+		cache:  e.cache,
 	}
 	tempEngine.funcMap = tempEngine.builtinFunctions()
 
@@ -93,12 +144,11 @@ func (e *Engine) builtinFunctions() template.FuncMap {
 	return template.FuncMap{
 		// file reads a file relative to the package directory
 		"file": func(path string) (string, error) {
-			fullPath := filepath.Join(e.pkgDir, path)
-			content, err := os.ReadFile(fullPath)
+			content, err := e.readFile(path)
 			if err != nil {
 				return "", fmt.Errorf("reading file %s: %w", path, err)
 			}
-			return string(content), nil
+			return content, nil
 		},
 
 		// env reads an environment variable with optional default
@@ -424,3 +424,59 @@ func TestEngine_ComplexTemplate(t *testing.T) {
 		t.Errorf("Render() =\n%s\n\nwant:\n%s", result, expected)
 	}
 }
+
+func TestEngine_TemplatefileReusedWithDifferentVars(t *testing.T) {
+	tmpDir := t.TempDir()
+	if err := os.WriteFile(filepath.Join(tmpDir, "item.tmpl"), []byte("[{{ .name }}]"), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	ctx := NewContext("my-plugin", "1.0.0", "/project", "claude-code")
+	engine := NewEngine(tmpDir, ctx)
+
+	result, err := engine.Render(`{{ templatefile "item.tmpl" (dict "name" "a") }}{{ templatefile "item.tmpl" (dict "name" "b") }}`)
+	if err != nil {
+		t.Fatalf("Render() error = %v", err)
+	}
+
+	expected := "[a][b]"
+	if result != expected {
+		t.Errorf("Render() = %q, want %q", result, expected)
+	}
+}
+
+func TestEngine_FileFunction_ReadsOncePerEngine(t *testing.T) {
+	tmpDir := t.TempDir()
+	path := filepath.Join(tmpDir, "fragment.txt")
+	if err := os.WriteFile(path, []byte("v1"), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	ctx := NewContext("my-plugin", "1.0.0", "/project", "claude-code")
+	engine := NewEngine(tmpDir, ctx)
+
+	if _, err := engine.Render(`{{ file "fragment.txt" }}`); err != nil {
+		t.Fatalf("Render() error = %v", err)
+	}
+
+	// The fragment is served from the engine's cache after the first read
+	if err := os.WriteFile(path, []byte("v2"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	result, err := engine.Render(`{{ file "fragment.txt" }}`)
+	if err != nil {
+		t.Fatalf("Render() error = %v", err)
+	}
+	if result != "v1" {
+		t.Errorf("Render() = %q, want %q", result, "v1")
+	}
+
+	// A new engine sees the updated file
+	result, err = NewEngine(tmpDir, ctx).Render(`{{ file "fragment.txt" }}`)
+	if err != nil {
+		t.Fatalf("Render() error = %v", err)
+	}
+	if result != "v2" {
+		t.Errorf("Render() = %q, want %q", result, "v2")
+	}
+}
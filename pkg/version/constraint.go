@@ -178,20 +178,24 @@ func (c *Constraint) Match(v *Version) bool {
 }
 
 // match evaluates a single check against a version.
+// Each check costs at most one Compare.
 func (chk *check) match(v *Version) bool {
-	switch chk.op {
-	case "latest":
+	if chk.op == "latest" {
 		return true
+	}
+
+	cmp := v.Compare(chk.version)
+	switch chk.op {
 	case "=":
-		return v.Equal(chk.version)
+		return cmp == 0
 	case ">":
-		return v.GreaterThan(chk.version)
+		return cmp > 0
 	case "<":
-		return v.LessThan(chk.version)
+		return cmp < 0
 	case ">=":
-		return v.GreaterThan(chk.version) || v.Equal(chk.version)
+		return cmp >= 0
 	case "<=":
-		return v.LessThan(chk.version) || v.Equal(chk.version)
+		return cmp <= 0
 	default:
 		return false
 	}
@@ -218,26 +222,25 @@ func (c *Constraint) String() string {
 //	}
 //	best := constraint.FindBest(versions) // Returns 1.5.0
 func (c *Constraint) FindBest(versions []*Version) *Version {
-	if len(versions) == 0 {
+	// An exact pin can only match versions equal to it, so the first match
+	// is the best one.
+	if len(c.checks) == 1 && c.checks[0].op == "=" {
+		for _, v := range versions {
+			if v != nil && v.Equal(c.checks[0].version) {
+				return v
+			}
+		}
 		return nil
 	}
 
-	// Filter to matching versions
-	var matching []*Version
+	// Track the running maximum in a single pass. Candidates that cannot beat
+	// the current best are skipped before the (more expensive) constraint check.
+	var best *Version
 	for _, v := range versions {
-		if c.Match(v) {
-			matching = append(matching, v)
+		if v == nil || (best != nil && !v.GreaterThan(best)) {
+			continue
 		}
-	}
-
-	if len(matching) == 0 {
-		return nil
-	}
-
-	// Find the highest matching version
-	best := matching[0]
-	for _, v := range matching[1:] {
-		if v.GreaterThan(best) {
+		if c.Match(v) {
 			best = v
 		}
 	}
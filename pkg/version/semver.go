@@ -49,6 +49,12 @@ func Parse(s string) (*Version, error) {
 		return nil, fmt.Errorf("version string cannot be empty")
 	}
 
+	// Every version starts with a digit or 'v'; reject other strings (e.g.
+	// non-release git tags) without running the regexp
+	if c := s[0]; c != 'v' && (c < '0' || c > '9') {
+		return nil, fmt.Errorf("invalid version format: %q", s)
+	}
+
 	matches := semverRegex.FindStringSubmatch(s)
 	if matches == nil {
 		return nil, fmt.Errorf("invalid version format: %q", s)
@@ -198,6 +198,9 @@ func TestParse_Invalid(t *testing.T) {
 		{name: "negative version", input: "-1.0.0"},
 		{name: "letters in version", input: "a.b.c"},
 		{name: "double dots", input: "1..0"},
+		{name: "non-release tag", input: "nightly-2024-01-01"},
+		{name: "v prefix only", input: "v"},
+		{name: "v prefix with text", input: "vnext"},
 	}
 
 	for _, tt := range tests {
@@ -989,3 +992,50 @@ func TestVersion_Prerelease_ComplexIdentifiers(t *testing.T) {
 		})
 	}
 }
+
+func TestConstraint_FindBest_Unsorted(t *testing.T) {
+	c, err := ParseConstraint("~1.2.0")
+	require.NoError(t, err)
+
+	versions := []*Version{
+		MustParse("1.3.0"),
+		MustParse("1.2.1"),
+		MustParse("2.0.0"),
+		MustParse("1.2.7"),
+		MustParse("1.2.3"),
+		MustParse("1.1.9"),
+	}
+
+	best := c.FindBest(versions)
+	require.NotNil(t, best)
+	assert.Equal(t, "1.2.7", best.String())
+}
+
+func TestConstraint_FindBest_ExactPin(t *testing.T) {
+	c, err := ParseConstraint("1.2.3")
+	require.NoError(t, err)
+
+	pinned := MustParse("1.2.3+build.1")
+	versions := []*Version{
+		MustParse("1.2.4"),
+		pinned,
+		MustParse("1.2.3+build.2"),
+		MustParse("2.0.0"),
+	}
+
+	// Build metadata is ignored, so the first equal version is returned
+	assert.Same(t, pinned, c.FindBest(versions))
+
+	c, err = ParseConstraint("=1.9.0")
+	require.NoError(t, err)
+	assert.Nil(t, c.FindBest(versions))
+}
+
+func TestConstraint_FindBest_SkipsNil(t *testing.T) {
+	c, err := ParseConstraint("^1.0.0")
+	require.NoError(t, err)
+
+	best := c.FindBest([]*Version{MustParse("1.1.0"), nil, MustParse("1.4.0")})
+	require.NotNil(t, best)
+	assert.Equal(t, "1.4.0", best.String())
+}